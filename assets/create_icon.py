@@ -37,5 +37,26 @@ def create_icon():
     print(f"Sizes embedded: {[img.size for img in images]}")
 
 
+def create_tray_icons():
+    """Create pre-sized 64x64 tray icons (normal and grayscale) from logo PNG."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    logo_path = os.path.join(script_dir, "logo.png")
+
+    logo = Image.open(logo_path)
+    if logo.mode != "RGBA":
+        logo = logo.convert("RGBA")
+
+    # Resize once here so the tray does not run LANCZOS at runtime
+    icon = logo.resize((64, 64), Image.Resampling.LANCZOS)
+    icon.save(os.path.join(script_dir, "logo_64.png"))
+
+    # Grayscale variant for the disabled state, preserving alpha
+    gray = icon.convert("L")
+    gray_icon = Image.merge("RGBA", (gray, gray, gray, icon.getchannel("A")))
+    gray_icon.save(os.path.join(script_dir, "logo_64_gray.png"))
+    print(f"Tray icons created in: {script_dir}")
+
+
 if __name__ == "__main__":
     create_icon()
+    create_tray_icons()
@@ -20,7 +20,7 @@ from .input.typer import TextTyper
 from .ui.overlay import RecordingOverlay
 from .ui.tray import SystemTray, get_asset_path
 from .ui.home import HomeWindow
-from .utils.logger import get_logger, setup_logging
+from .utils.logger import get_logger, setup_logging, shutdown_logging
 
 logger = get_logger("app")
 
@@ -115,7 +115,6 @@ class DitadoApp:
             set_autostart(self._settings.auto_start_on_boot)
 
         # Start components
-        self._overlay.start()
         self._tray.start()
         self._hotkey.start()
 
@@ -130,6 +129,9 @@ class DitadoApp:
         self._root.geometry("1x1+0+0")  # Tiny window
         self._root.withdraw()  # Hide the main window
 
+        # Overlay shares the main Tk interpreter as a Toplevel
+        self._overlay.attach(self._root)
+
         # Set window icon for taskbar (300ms delay to override CustomTkinter's default at 200ms)
         try:
             icon_path = get_asset_path("icon.ico")
@@ -162,7 +164,7 @@ class DitadoApp:
         except Exception as e:
             logger.debug(f"Error stopping hotkey: {e}")
 
-        # Stop overlay (has its own Tkinter instance)
+        # Stop overlay (Toplevel of the main root)
         try:
             self._overlay.stop()
         except Exception as e:
@@ -201,6 +203,9 @@ class DitadoApp:
 
         logger.info("Ditado shutdown complete")
 
+        # os._exit skips atexit, so write out pending log records first
+        shutdown_logging()
+
         # Force terminate the process to ensure all threads exit
         # Use os._exit for immediate termination (skips cleanup handlers)
         # This is necessary because daemon threads may still be running
@@ -0,0 +1,19 @@
+"""Asset path resolution shared by the UI modules."""
+
+import os
+import sys
+from functools import lru_cache
+
+
+if getattr(sys, 'frozen', False):
+    # Running as bundled exe
+    _BASE_PATH = sys._MEIPASS
+else:
+    # Running in development
+    _BASE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@lru_cache(maxsize=None)
+def asset_path(filename: str) -> str:
+    """Get the path to an asset file, works for both dev and bundled exe."""
+    return os.path.join(_BASE_PATH, "assets", filename)
@@ -1,7 +1,5 @@
 """Unified Dashboard for Ditado - Modern Light Theme Design."""
 
-import os
-import sys
 import customtkinter as ctk
 import threading
 import webbrowser
@@ -13,17 +11,7 @@ from ..config.history import TranscriptionHistory, TranscriptionHistoryEntry, fo
 from ..transcription.whisper import SUPPORTED_LANGUAGES
 from ..input.hotkey import KeyCombinationCaptureDialog, format_hotkey_display
 from ..audio.recorder import list_audio_devices
-
-
-def get_asset_path(filename: str) -> str:
-    """Get the path to an asset file, works for both dev and bundled exe."""
-    if getattr(sys, 'frozen', False):
-        # Running as bundled exe
-        base_path = sys._MEIPASS
-    else:
-        # Running in development
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    return os.path.join(base_path, "assets", filename)
+from ._assets import asset_path as get_asset_path
 
 
 # ============================================
@@ -329,6 +317,7 @@ class HistoryItem(ctk.CTkFrame):
     def __init__(self, parent, entry: TranscriptionHistoryEntry, **kwargs):
         super().__init__(parent, fg_color=BG_CARD, corner_radius=12, **kwargs)
 
+        self._entry_id = entry.id
         self._full_text = entry.text
         self._parent_widget = parent
 
@@ -345,14 +334,15 @@ class HistoryItem(ctk.CTkFrame):
         ).pack(side="left")
 
         # Timestamp
-        ctk.CTkLabel(
+        self._time_label = ctk.CTkLabel(
             content,
             text=format_relative_time(entry.timestamp),
             font=ctk.CTkFont(size=11),
             text_color=TEXT_MUTED,
             width=80,
             anchor="w",
-        ).pack(side="left")
+        )
+        self._time_label.pack(side="left")
 
         # Text preview
         text_preview = entry.text[:70] + "..." if len(entry.text) > 70 else entry.text
@@ -397,6 +387,16 @@ class HistoryItem(ctk.CTkFrame):
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
 
+    @property
+    def entry_id(self) -> str:
+        return self._entry_id
+
+    def update_entry(self, entry: TranscriptionHistoryEntry) -> None:
+        """Refresh the relative timestamp in place."""
+        time_text = format_relative_time(entry.timestamp)
+        if self._time_label.cget("text") != time_text:
+            self._time_label.configure(text=time_text)
+
     def _on_enter(self, event) -> None:
         self.configure(fg_color=BG_CARD_HOVER)
         self._copy_btn.configure(fg_color=ACCENT_LIME_LIGHT)
@@ -437,6 +437,9 @@ class HomeWindow:
         self._on_minimize = on_minimize
         self._on_close = on_close
         self._window: Optional[ctk.CTkToplevel] = None
+        self._alive = False  # Python-side mirror of window existence
+        self._refresh_pending = False
+        self._stats_refresh_pending = False
 
         # Tab management
         self._current_tab = "dashboard"
@@ -449,6 +452,9 @@ class HomeWindow:
         self._wpm_card: Optional[ModernStatsCard] = None
         self._info_card: Optional[InfoCard] = None
         self._history_list: Optional[ctk.CTkScrollableFrame] = None
+        self._history_widgets: List[HistoryItem] = []
+        self._history_empty: Optional[ctk.CTkFrame] = None
+        self._history_empty_hint: Optional[ctk.CTkLabel] = None
         self._api_warning_frame: Optional[ctk.CTkFrame] = None
         self._onboarding_card: Optional[OnboardingCard] = None
 
@@ -472,6 +478,16 @@ class HomeWindow:
         self._save_btn: Optional[ctk.CTkButton] = None
         self._toast_frame: Optional[ctk.CTkFrame] = None
 
+        # Analytics value labels, updated in place on tab switch
+        self._stat_labels: dict = {}
+        self._stat_row_count: dict = {}
+
+        # Shared fonts for the recurring header/stat-row helpers (created in show())
+        self._tab_title_font: Optional[ctk.CTkFont] = None
+        self._section_font: Optional[ctk.CTkFont] = None
+        self._body_font: Optional[ctk.CTkFont] = None
+        self._body_bold_font: Optional[ctk.CTkFont] = None
+
         # Other state
         self._audio_devices = []
         self._capturing_hotkey = False
@@ -489,7 +505,7 @@ class HomeWindow:
 
     def show(self, parent: Optional[ctk.CTk] = None) -> None:
         """Show the dashboard window."""
-        if self._window is not None and self._window.winfo_exists():
+        if self._alive:
             self._window.focus()
             self._window.deiconify()
             return
@@ -504,6 +520,14 @@ class HomeWindow:
         self._window.minsize(900, 650)
         self._window.configure(fg_color=BG_MAIN)
         self._window.protocol("WM_DELETE_WINDOW", self._handle_close)
+        self._alive = True
+        self._window.bind("<Destroy>", self._on_destroy, add="+")
+
+        # Fonts need a Tk root, so allocate them once the window exists
+        self._tab_title_font = ctk.CTkFont(size=26, weight="bold")
+        self._section_font = ctk.CTkFont(size=15, weight="bold")
+        self._body_font = ctk.CTkFont(size=14)
+        self._body_bold_font = ctk.CTkFont(size=14, weight="bold")
 
         # Set window icon
         try:
@@ -653,6 +677,9 @@ class HomeWindow:
             else:
                 btn.configure(fg_color="transparent", text_color=ICON_INACTIVE)
 
+        if tab_name == "analytics":
+            self._refresh_analytics()
+
         self._show_tab(tab_name)
 
     def _show_tab(self, tab_name: str) -> None:
@@ -668,6 +695,7 @@ class HomeWindow:
     # ========================
     def _build_dashboard_tab(self) -> None:
         """Build the dashboard tab content."""
+        s = self._settings
         tab = ctk.CTkFrame(self._content_frame, fg_color="transparent")
         self._tab_frames["dashboard"] = tab
 
@@ -730,8 +758,8 @@ class HomeWindow:
 
         # Check if this is a first-time user (no API key and no transcriptions)
         is_first_time_user = (
-            not self._settings.is_configured() and
-            self._settings.stats.total_requests == 0
+            not s.is_configured() and
+            s.stats.total_requests == 0
         )
 
         # Onboarding card for first-time users
@@ -747,7 +775,7 @@ class HomeWindow:
         else:
             # API warning (only show if not first-time user but still not configured)
             self._api_warning_frame = ctk.CTkFrame(tab, fg_color="#FFF8E1", corner_radius=12)
-            if not self._settings.is_configured():
+            if not s.is_configured():
                 self._api_warning_frame.pack(fill="x", pady=(0, 20))
                 warn_content = ctk.CTkFrame(self._api_warning_frame, fg_color="transparent")
                 warn_content.pack(fill="x", padx=16, pady=12)
@@ -772,7 +800,7 @@ class HomeWindow:
         cards_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
         # Words card
-        words = self._settings.stats.total_words
+        words = s.stats.total_words
         words_pct = min(100, int((words / 10000) * 100)) if words else 0
         self._words_card = ModernStatsCard(
             cards_frame,
@@ -785,7 +813,7 @@ class HomeWindow:
         self._words_card.grid(row=0, column=0, padx=(0, 10), sticky="nsew")
 
         # WPM card
-        wpm = self._settings.get_estimated_wpm()
+        wpm = s.get_estimated_wpm()
         wpm_pct = min(100, int((wpm / 150) * 100)) if wpm else 0
         self._wpm_card = ModernStatsCard(
             cards_frame,
@@ -801,7 +829,7 @@ class HomeWindow:
         # Info card
         self._info_card = InfoCard(cards_frame)
         self._info_card.grid(row=0, column=2, padx=(10, 0), sticky="nsew")
-        self._info_card.set_hotkey(self._settings.hotkey)
+        self._info_card.set_hotkey(s.hotkey)
 
         # History section
         history_frame = ctk.CTkFrame(tab, fg_color="transparent")
@@ -842,6 +870,7 @@ class HomeWindow:
     # ========================
     def _build_settings_tab(self) -> None:
         """Build the settings tab content."""
+        s = self._settings
         tab = ctk.CTkFrame(self._content_frame, fg_color="transparent")
         self._tab_frames["settings"] = tab
 
@@ -876,7 +905,7 @@ class HomeWindow:
         )
         self._hotkey_entry.pack(side="left", padx=(0, 12))
         # Insert value explicitly (CTkEntry doesn't always show textvariable on readonly)
-        self._hotkey_entry.insert(0, self._settings.hotkey)
+        self._hotkey_entry.insert(0, s.hotkey)
         self._hotkey_entry.configure(state="readonly")
 
         self._capture_btn = ctk.CTkButton(
@@ -904,9 +933,9 @@ class HomeWindow:
         device_names = ["System Default"] + [d["name"] for d in self._audio_devices]
 
         current_device = "System Default"
-        if self._settings.audio_device_index is not None:
+        if s.audio_device_index is not None:
             for d in self._audio_devices:
-                if d["index"] == self._settings.audio_device_index:
+                if d["index"] == s.audio_device_index:
                     current_device = d["name"]
                     break
 
@@ -920,6 +949,7 @@ class HomeWindow:
             button_color=ACCENT_LIME,
             button_hover_color=ACCENT_LIME_DARK,
             text_color=TEXT_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(0, 8))
 
         mic_btn_row = ctk.CTkFrame(mic_frame, fg_color="transparent")
@@ -952,7 +982,7 @@ class HomeWindow:
         ).pack(anchor="w", padx=20, pady=(16, 8))
 
         lang_options = [f"{code}: {name}" for code, name in SUPPORTED_LANGUAGES.items()]
-        current_lang = f"{self._settings.language}: {SUPPORTED_LANGUAGES.get(self._settings.language, 'Unknown')}"
+        current_lang = f"{s.language}: {SUPPORTED_LANGUAGES.get(s.language, 'Unknown')}"
 
         self._lang_var = ctk.StringVar(value=current_lang)
         ctk.CTkOptionMenu(
@@ -964,6 +994,7 @@ class HomeWindow:
             button_color=ACCENT_LIME,
             button_hover_color=ACCENT_LIME_DARK,
             text_color=TEXT_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(0, 16))
 
         # Preferences Section
@@ -973,7 +1004,7 @@ class HomeWindow:
         enhance_frame = ctk.CTkFrame(scroll, fg_color=BG_CARD, corner_radius=12)
         enhance_frame.pack(fill="x", pady=(0, 10))
 
-        self._enhance_var = ctk.BooleanVar(value=self._settings.enhance_text)
+        self._enhance_var = ctk.BooleanVar(value=s.enhance_text)
         ctk.CTkSwitch(
             enhance_frame,
             text="AI Text Enhancement (GPT cleanup)",
@@ -982,6 +1013,7 @@ class HomeWindow:
             text_color=TEXT_DARK,
             progress_color=ACCENT_LIME,
             button_color=ACCENT_LIME_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(16, 4))
 
         ctk.CTkLabel(
@@ -1001,7 +1033,7 @@ class HomeWindow:
         ).pack(anchor="w", padx=20, pady=(16, 8))
 
         positions = ["top-left", "top-right", "bottom-left", "bottom-right", "bottom-center"]
-        self._pos_var = ctk.StringVar(value=self._settings.indicator_position)
+        self._pos_var = ctk.StringVar(value=s.indicator_position)
         ctk.CTkOptionMenu(
             pos_frame,
             variable=self._pos_var,
@@ -1011,6 +1043,7 @@ class HomeWindow:
             button_color=ACCENT_LIME,
             button_hover_color=ACCENT_LIME_DARK,
             text_color=TEXT_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(0, 16))
 
         # Recording Limits
@@ -1034,7 +1067,7 @@ class HomeWindow:
 
         current_duration = "5 min"
         for name, secs in self._duration_values.items():
-            if secs == self._settings.max_recording_seconds:
+            if secs == s.max_recording_seconds:
                 current_duration = name
                 break
 
@@ -1048,9 +1081,10 @@ class HomeWindow:
             button_color=ACCENT_LIME,
             button_hover_color=ACCENT_LIME_DARK,
             text_color=TEXT_DARK,
+            hover=False,
         ).pack(side="left", padx=(12, 0))
 
-        self._auto_stop_var = ctk.BooleanVar(value=self._settings.auto_stop_recording)
+        self._auto_stop_var = ctk.BooleanVar(value=s.auto_stop_recording)
         ctk.CTkSwitch(
             limits_frame,
             text="Auto-stop when limit reached",
@@ -1059,6 +1093,7 @@ class HomeWindow:
             text_color=TEXT_DARK,
             progress_color=ACCENT_LIME,
             button_color=ACCENT_LIME_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(4, 16))
 
         # System Audio Section
@@ -1067,7 +1102,7 @@ class HomeWindow:
         mute_frame = ctk.CTkFrame(scroll, fg_color=BG_CARD, corner_radius=12)
         mute_frame.pack(fill="x", pady=(0, 10))
 
-        self._mute_audio_var = ctk.BooleanVar(value=self._settings.mute_system_audio)
+        self._mute_audio_var = ctk.BooleanVar(value=s.mute_system_audio)
         ctk.CTkSwitch(
             mute_frame,
             text="Mute system audio while recording",
@@ -1076,6 +1111,7 @@ class HomeWindow:
             text_color=TEXT_DARK,
             progress_color=ACCENT_LIME,
             button_color=ACCENT_LIME_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(16, 4))
 
         ctk.CTkLabel(
@@ -1089,7 +1125,7 @@ class HomeWindow:
         sound_frame = ctk.CTkFrame(scroll, fg_color=BG_CARD, corner_radius=12)
         sound_frame.pack(fill="x", pady=(0, 10))
 
-        self._sound_feedback_var = ctk.BooleanVar(value=self._settings.sound_feedback)
+        self._sound_feedback_var = ctk.BooleanVar(value=s.sound_feedback)
         ctk.CTkSwitch(
             sound_frame,
             text="Sound feedback",
@@ -1098,6 +1134,7 @@ class HomeWindow:
             text_color=TEXT_DARK,
             progress_color=ACCENT_LIME,
             button_color=ACCENT_LIME_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(16, 4))
 
         ctk.CTkLabel(
@@ -1113,7 +1150,7 @@ class HomeWindow:
         autostart_frame = ctk.CTkFrame(scroll, fg_color=BG_CARD, corner_radius=12)
         autostart_frame.pack(fill="x", pady=(0, 10))
 
-        self._autostart_var = ctk.BooleanVar(value=self._settings.auto_start_on_boot)
+        self._autostart_var = ctk.BooleanVar(value=s.auto_start_on_boot)
         ctk.CTkSwitch(
             autostart_frame,
             text="Start Ditado when Windows boots",
@@ -1122,6 +1159,7 @@ class HomeWindow:
             text_color=TEXT_DARK,
             progress_color=ACCENT_LIME,
             button_color=ACCENT_LIME_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(16, 4))
 
         ctk.CTkLabel(
@@ -1139,6 +1177,7 @@ class HomeWindow:
     # ========================
     def _build_api_tab(self) -> None:
         """Build the API configuration tab."""
+        s = self._settings
         tab = ctk.CTkFrame(self._content_frame, fg_color="transparent")
         self._tab_frames["api"] = tab
 
@@ -1171,8 +1210,8 @@ class HomeWindow:
         )
         self._api_key_entry.pack(anchor="w", padx=20, pady=(0, 8))
         # Insert value explicitly if exists
-        if self._settings.api_key:
-            self._api_key_entry.insert(0, self._settings.api_key)
+        if s.api_key:
+            self._api_key_entry.insert(0, s.api_key)
 
         btn_row = ctk.CTkFrame(key_frame, fg_color="transparent")
         btn_row.pack(anchor="w", padx=20, pady=(0, 8))
@@ -1264,7 +1303,7 @@ class HomeWindow:
             text_color=TEXT_GRAY,
         ).pack(anchor="w", padx=20, pady=(16, 8))
 
-        self._whisper_var = ctk.StringVar(value=self._settings.whisper_model)
+        self._whisper_var = ctk.StringVar(value=s.whisper_model)
         ctk.CTkOptionMenu(
             models_frame,
             variable=self._whisper_var,
@@ -1274,6 +1313,7 @@ class HomeWindow:
             button_color=ACCENT_LIME,
             button_hover_color=ACCENT_LIME_DARK,
             text_color=TEXT_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(0, 12))
 
         ctk.CTkLabel(
@@ -1282,7 +1322,7 @@ class HomeWindow:
             text_color=TEXT_GRAY,
         ).pack(anchor="w", padx=20, pady=(8, 8))
 
-        self._gpt_var = ctk.StringVar(value=self._settings.gpt_model)
+        self._gpt_var = ctk.StringVar(value=s.gpt_model)
         ctk.CTkOptionMenu(
             models_frame,
             variable=self._gpt_var,
@@ -1292,6 +1332,7 @@ class HomeWindow:
             button_color=ACCENT_LIME,
             button_hover_color=ACCENT_LIME_DARK,
             text_color=TEXT_DARK,
+            hover=False,
         ).pack(anchor="w", padx=20, pady=(0, 16))
 
         # Save button
@@ -1302,6 +1343,7 @@ class HomeWindow:
     # ========================
     def _build_analytics_tab(self) -> None:
         """Build the analytics/usage tab."""
+        s = self._settings
         tab = ctk.CTkFrame(self._content_frame, fg_color="transparent")
         self._tab_frames["analytics"] = tab
 
@@ -1311,8 +1353,8 @@ class HomeWindow:
         scroll = ctk.CTkScrollableFrame(tab, fg_color="transparent")
         scroll.pack(fill="both", expand=True)
 
-        stats = self._settings.stats
-        costs = self._settings.get_estimated_cost()
+        stats = s.stats
+        costs = s.get_estimated_cost()
 
         # Session stats
         self._build_section_header(scroll, "This Session")
@@ -1320,8 +1362,11 @@ class HomeWindow:
         session_frame = ctk.CTkFrame(scroll, fg_color=BG_CARD, corner_radius=12)
         session_frame.pack(fill="x", pady=(0, 20))
 
-        self._add_stat_row(session_frame, "Transcriptions", str(stats.session_requests))
-        self._add_stat_row(session_frame, "Minutes", f"{stats.session_minutes:.2f}")
+        labels = self._stat_labels
+        labels["session_requests"] = self._add_stat_row(
+            session_frame, "Transcriptions", str(stats.session_requests))
+        labels["session_minutes"] = self._add_stat_row(
+            session_frame, "Minutes", f"{stats.session_minutes:.2f}")
 
         # All-time stats
         self._build_section_header(scroll, "All Time")
@@ -1329,10 +1374,14 @@ class HomeWindow:
         total_frame = ctk.CTkFrame(scroll, fg_color=BG_CARD, corner_radius=12)
         total_frame.pack(fill="x", pady=(0, 20))
 
-        self._add_stat_row(total_frame, "Transcriptions", str(stats.total_requests))
-        self._add_stat_row(total_frame, "Minutes", f"{stats.total_minutes:.2f}")
-        self._add_stat_row(total_frame, "Words", str(stats.total_words))
-        self._add_stat_row(total_frame, "Weeks Active", str(self._settings.get_weeks_active()))
+        labels["total_requests"] = self._add_stat_row(
+            total_frame, "Transcriptions", str(stats.total_requests))
+        labels["total_minutes"] = self._add_stat_row(
+            total_frame, "Minutes", f"{stats.total_minutes:.2f}")
+        labels["total_words"] = self._add_stat_row(
+            total_frame, "Words", str(stats.total_words))
+        labels["weeks_active"] = self._add_stat_row(
+            total_frame, "Weeks Active", str(s.get_weeks_active()))
 
         # Cost estimates
         self._build_section_header(scroll, "Estimated Costs")
@@ -1340,9 +1389,12 @@ class HomeWindow:
         cost_frame = ctk.CTkFrame(scroll, fg_color=BG_CARD, corner_radius=12)
         cost_frame.pack(fill="x", pady=(0, 20))
 
-        self._add_stat_row(cost_frame, "Whisper", f"${costs['whisper']:.4f}")
-        self._add_stat_row(cost_frame, "GPT Enhancement", f"${costs['gpt']:.4f}")
-        self._add_stat_row(cost_frame, "Total", f"${costs['total']:.4f}", bold=True, color=SUCCESS)
+        labels["cost_whisper"] = self._add_stat_row(
+            cost_frame, "Whisper", f"${costs['whisper']:.4f}")
+        labels["cost_gpt"] = self._add_stat_row(
+            cost_frame, "GPT Enhancement", f"${costs['gpt']:.4f}")
+        labels["cost_total"] = self._add_stat_row(
+            cost_frame, "Total", f"${costs['total']:.4f}", bold=True, color=SUCCESS)
 
         # Pricing info
         ctk.CTkLabel(
@@ -1362,7 +1414,10 @@ class HomeWindow:
 
         # Help link row
         help_row = ctk.CTkFrame(about_frame, fg_color="transparent")
-        help_row.pack(fill="x", padx=20, pady=10)
+        help_row.grid(
+            row=self._next_stat_row(about_frame), column=0, columnspan=2,
+            sticky="ew", padx=20, pady=10,
+        )
 
         ctk.CTkLabel(
             help_row, text="Need help?",
@@ -1393,13 +1448,13 @@ class HomeWindow:
 
         ctk.CTkLabel(
             header, text=title,
-            font=ctk.CTkFont(size=26, weight="bold"),
+            font=self._tab_title_font,
             text_color=TEXT_DARK,
         ).pack(anchor="w")
 
         ctk.CTkLabel(
             header, text=subtitle,
-            font=ctk.CTkFont(size=14),
+            font=self._body_font,
             text_color=TEXT_GRAY,
         ).pack(anchor="w", pady=(4, 0))
 
@@ -1407,26 +1462,35 @@ class HomeWindow:
         """Add a section header."""
         ctk.CTkLabel(
             parent, text=text,
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=self._section_font,
             text_color=TEXT_DARK,
         ).pack(anchor="w", pady=(20, 12))
 
-    def _add_stat_row(self, parent, label: str, value: str, bold: bool = False, color: str = None) -> None:
-        """Add a stat row to a frame."""
-        row = ctk.CTkFrame(parent, fg_color="transparent")
-        row.pack(fill="x", padx=20, pady=10)
+    def _add_stat_row(self, parent, label: str, value: str, bold: bool = False, color: str = None) -> ctk.CTkLabel:
+        """Add a stat row to a two-column grid frame and return its value label."""
+        r = self._next_stat_row(parent)
 
         ctk.CTkLabel(
-            row, text=label,
-            font=ctk.CTkFont(size=14),
+            parent, text=label,
+            font=self._body_font,
             text_color=TEXT_GRAY,
-        ).pack(side="left")
+        ).grid(row=r, column=0, sticky="w", padx=20, pady=10)
 
-        ctk.CTkLabel(
-            row, text=value,
-            font=ctk.CTkFont(size=14, weight="bold" if bold else "normal"),
+        value_label = ctk.CTkLabel(
+            parent, text=value,
+            font=self._body_bold_font if bold else self._body_font,
             text_color=color or TEXT_DARK,
-        ).pack(side="right")
+        )
+        value_label.grid(row=r, column=1, sticky="e", padx=20, pady=10)
+        return value_label
+
+    def _next_stat_row(self, parent) -> int:
+        """Reserve the next grid row in a stat card frame."""
+        r = self._stat_row_count.get(parent, 0)
+        if r == 0:
+            parent.grid_columnconfigure(1, weight=1)
+        self._stat_row_count[parent] = r + 1
+        return r
 
     def _add_save_button(self, parent) -> None:
         """Add save button to a tab."""
@@ -1473,7 +1537,7 @@ class HomeWindow:
         self._hotkey_entry.insert(0, "Hold 1-2 keys...")
 
         def on_key_captured(hotkey_str: str):
-            if self._window and self._window.winfo_exists():
+            if self._alive:
                 self._window.after(0, lambda: self._finish_hotkey_capture(hotkey_str))
 
         # Use combination capture dialog (supports single keys and combos)
@@ -1550,7 +1614,8 @@ class HomeWindow:
                     return
 
                 client = OpenAI(api_key=api_key)
-                client.models.list()
+                # Fetch a single model object to validate the key cheaply
+                client.models.retrieve("whisper-1")
                 self._api_status.configure(text="Connection successful!", text_color=SUCCESS)
             except Exception as e:
                 self._api_status.configure(text=f"Error: {str(e)[:40]}", text_color=ERROR)
@@ -1560,40 +1625,55 @@ class HomeWindow:
 
     def _save_settings(self) -> None:
         """Save all settings."""
-        # Update settings object
-        self._settings.hotkey = self._hotkey_entry.get().strip()
-        self._settings.language = self._lang_var.get().split(":")[0]
-        self._settings.indicator_position = self._pos_var.get()
-        self._settings.enhance_text = self._enhance_var.get()
-        self._settings.api_key = self._api_key_entry.get().strip()
-        self._settings.whisper_model = self._whisper_var.get()
-        self._settings.gpt_model = self._gpt_var.get()
-        self._settings.max_recording_seconds = self._duration_values.get(self._duration_var.get(), 300)
-        self._settings.auto_stop_recording = self._auto_stop_var.get()
-        self._settings.mute_system_audio = self._mute_audio_var.get()
-        self._settings.sound_feedback = self._sound_feedback_var.get()
-        self._settings.auto_start_on_boot = self._autostart_var.get()
+        # Collect values from the form
+        new = {
+            "hotkey": self._hotkey_entry.get().strip(),
+            "language": self._lang_var.get().split(":")[0],
+            "indicator_position": self._pos_var.get(),
+            "enhance_text": self._enhance_var.get(),
+            "api_key": self._api_key_entry.get().strip(),
+            "whisper_model": self._whisper_var.get(),
+            "gpt_model": self._gpt_var.get(),
+            "max_recording_seconds": self._duration_values.get(self._duration_var.get(), 300),
+            "auto_stop_recording": self._auto_stop_var.get(),
+            "mute_system_audio": self._mute_audio_var.get(),
+            "sound_feedback": self._sound_feedback_var.get(),
+            "auto_start_on_boot": self._autostart_var.get(),
+            "audio_device_index": self._settings.audio_device_index,
+        }
 
         # Audio device
         selected_name = self._audio_device_var.get()
         if selected_name == "System Default":
-            self._settings.audio_device_index = None
+            new["audio_device_index"] = None
         else:
             for d in self._audio_devices:
                 if d["name"] == selected_name:
-                    self._settings.audio_device_index = d["index"]
+                    new["audio_device_index"] = d["index"]
                     break
 
+        old = {k: getattr(self._settings, k) for k in new}
+
+        # Nothing changed - skip the disk write and registry update
+        if new == old:
+            self._show_save_toast()
+            return
+
+        # Update settings object
+        for key, value in new.items():
+            setattr(self._settings, key, value)
+
         # Save to file
         self._settings.save()
 
-        # Apply autostart setting to Windows registry
-        from ..utils.autostart import set_autostart
-        set_autostart(self._settings.auto_start_on_boot)
+        # Apply autostart setting to Windows registry (only when it changed)
+        if new["auto_start_on_boot"] != old["auto_start_on_boot"]:
+            from ..utils.autostart import set_autostart
+            set_autostart(self._settings.auto_start_on_boot)
 
-        # Update UI
-        self._update_info_card()
-        self._update_api_warning()
+        # Update UI in the idle slice so the toast appears immediately
+        self._window.after_idle(self._update_info_card)
+        self._window.after_idle(self._update_api_warning)
 
         # Callback
         if self._on_save:
@@ -1604,7 +1684,7 @@ class HomeWindow:
 
     def _show_save_toast(self) -> None:
         """Show a prominent toast notification for save confirmation."""
-        if not self._window or not self._window.winfo_exists():
+        if not self._alive:
             return
 
         # Remove existing toast if any
@@ -1717,19 +1797,60 @@ class HomeWindow:
             self._window.withdraw()
 
     def close(self) -> None:
+        self._reset_window_state()
         if self._window:
             self._window.destroy()
             self._window = None
 
+    def _on_destroy(self, event) -> None:
+        # <Destroy> also fires for every child widget; only track the window
+        if event.widget is self._window:
+            self._reset_window_state()
+
+    def _reset_window_state(self) -> None:
+        """Forget widget references so the next show() starts clean."""
+        self._alive = False
+        self._refresh_pending = False
+        self._stats_refresh_pending = False
+        self._history_widgets = []
+        self._history_empty = None
+        self._history_empty_hint = None
+        self._stat_labels = {}
+        self._stat_row_count = {}
+
     def refresh(self) -> None:
-        """Refresh all dashboard content."""
-        self.refresh_stats()
+        """Refresh all dashboard content (coalesced into the next idle slice)."""
+        if self._refresh_pending or not self._alive:
+            return
+        self._refresh_pending = True
+        self._window.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        if not self._alive:
+            return  # Window closed after this idle callback was queued
+        self._update_stats()
         self.refresh_history()
         self._update_info_card()
+        if self._current_tab == "analytics":
+            self._refresh_analytics()
 
     def refresh_stats(self) -> None:
-        """Update statistics display."""
-        if not self._window or not self._window.winfo_exists():
+        """Update statistics display (coalesced into the next idle slice)."""
+        if self._stats_refresh_pending or self._refresh_pending or not self._alive:
+            return
+        self._stats_refresh_pending = True
+        self._window.after_idle(self._do_refresh_stats)
+
+    def _do_refresh_stats(self) -> None:
+        self._stats_refresh_pending = False
+        if not self._alive:
+            return
+        self._update_stats()
+
+    def _update_stats(self) -> None:
+        """Update the stats cards."""
+        if not self._alive:
             return
 
         if self._words_card:
@@ -1743,36 +1864,98 @@ class HomeWindow:
             self._wpm_card.set_percentage(min(100, int((wpm / 150) * 100)) if wpm else 0)
 
     def refresh_history(self) -> None:
-        """Update history list."""
-        if not self._window or not self._window.winfo_exists() or not self._history_list:
+        """Update history list, only touching items that were added or removed."""
+        if not self._alive or not self._history_list:
             return
 
-        for widget in self._history_list.winfo_children():
-            widget.destroy()
-
         entries = self._history.get_recent(20)
+        new_ids = {entry.id for entry in entries}
+
+        # Drop widgets whose entries are gone
+        kept = []
+        for widget in self._history_widgets:
+            if widget.entry_id in new_ids:
+                kept.append(widget)
+            else:
+                widget.destroy()
+        self._history_widgets = kept
 
         if not entries:
-            empty_frame = ctk.CTkFrame(self._history_list, fg_color="transparent")
-            empty_frame.pack(fill="both", expand=True, pady=40)
+            if self._history_empty is None:
+                self._history_empty = self._build_history_empty()
+            else:
+                self._history_empty_hint.configure(text=self._history_empty_text())
+            return
 
-            ctk.CTkLabel(
-                empty_frame,
-                text="No transcriptions yet",
-                font=ctk.CTkFont(size=16),
-                text_color=TEXT_MUTED,
-            ).pack()
+        if self._history_empty is not None:
+            self._history_empty.destroy()
+            self._history_empty = None
 
-            ctk.CTkLabel(
-                empty_frame,
-                text=f"Hold your hotkey ({self._settings.hotkey}) to start dictating",
-                font=ctk.CTkFont(size=13),
-                text_color=TEXT_MUTED,
-            ).pack(pady=(8, 0))
+        # Entries keep their relative order, so new ones are packed before
+        # the next surviving widget (or appended at the end)
+        existing = {widget.entry_id: widget for widget in kept}
+        widgets = []
+        next_kept = 0
+        for entry in entries:
+            widget = existing.get(entry.id)
+            if widget is not None:
+                widget.update_entry(entry)
+                next_kept += 1
+            else:
+                widget = HistoryItem(self._history_list, entry)
+                if next_kept < len(kept):
+                    widget.pack(fill="x", pady=4, before=kept[next_kept])
+                else:
+                    widget.pack(fill="x", pady=4)
+            widgets.append(widget)
+        self._history_widgets = widgets
+
+    def _build_history_empty(self) -> ctk.CTkFrame:
+        """Build the placeholder shown when there is no history."""
+        empty_frame = ctk.CTkFrame(self._history_list, fg_color="transparent")
+        empty_frame.pack(fill="both", expand=True, pady=40)
+
+        ctk.CTkLabel(
+            empty_frame,
+            text="No transcriptions yet",
+            font=ctk.CTkFont(size=16),
+            text_color=TEXT_MUTED,
+        ).pack()
+
+        self._history_empty_hint = ctk.CTkLabel(
+            empty_frame,
+            text=self._history_empty_text(),
+            font=ctk.CTkFont(size=13),
+            text_color=TEXT_MUTED,
+        )
+        self._history_empty_hint.pack(pady=(8, 0))
+        return empty_frame
+
+    def _history_empty_text(self) -> str:
+        return f"Hold your hotkey ({self._settings.hotkey}) to start dictating"
+
+    def _refresh_analytics(self) -> None:
+        """Update analytics values in place without rebuilding the tab."""
+        if not self._stat_labels:
             return
 
-        for entry in entries:
-            HistoryItem(self._history_list, entry).pack(fill="x", pady=4)
+        stats = self._settings.stats
+        costs = self._settings.get_estimated_cost()
+        values = {
+            "session_requests": str(stats.session_requests),
+            "session_minutes": f"{stats.session_minutes:.2f}",
+            "total_requests": str(stats.total_requests),
+            "total_minutes": f"{stats.total_minutes:.2f}",
+            "total_words": str(stats.total_words),
+            "weeks_active": str(self._settings.get_weeks_active()),
+            "cost_whisper": f"${costs['whisper']:.4f}",
+            "cost_gpt": f"${costs['gpt']:.4f}",
+            "cost_total": f"${costs['total']:.4f}",
+        }
+        for key, text in values.items():
+            label = self._stat_labels.get(key)
+            if label is not None and label.cget("text") != text:
+                label.configure(text=text)
 
     def _update_info_card(self) -> None:
         """Update the info card hotkey hint."""
@@ -1,15 +1,27 @@
 """Modern recording overlay indicator for Ditado - Wispr Flow inspired."""
 
 import tkinter as tk
-from typing import Optional, List
-import threading
-import math
-import random
+from typing import Optional, List, Union
+import time
+import queue
+from collections import deque
+import numpy as np
 
 
 class RecordingOverlay:
     """Modern floating overlay with animated soundwave indicator."""
 
+    # Fixed attribute layout - most of these are read every animation frame
+    __slots__ = (
+        "_position", "_master", "_window", "_owns_root", "_canvas", "_state", "_visible",
+        "_running", "_loop_armed", "_update_queue",
+        "_start_time", "_elapsed", "_net_delays", "_net_delay_total",
+        "_bar_heights", "_bar_targets", "_bar_phases", "_noise", "_noise_idx",
+        "_success_progress", "_animators", "_dirty", "_last_state_drawn",
+        "_bg_item_id", "_bar_item_ids", "_check_item_ids", "_drawn_color",
+        "_check_color", "_check_visible",
+    )
+
     # Pill shape dimensions
     WIDTH = 80
     HEIGHT = 36
@@ -21,6 +33,15 @@ class RecordingOverlay:
     BAR_PROCESSING = "#42A5F5"    # Blue for transcribing
     BAR_ENHANCING = "#AB47BC"     # Purple for enhancing
     BAR_SUCCESS = "#66BB6A"       # Green for typing/success
+    IDLE_COLOR = "#555555"        # Idle gray
+
+    STATE_COLORS = {
+        "recording": BAR_RECORDING,
+        "transcribing": BAR_PROCESSING,
+        "processing": BAR_PROCESSING,
+        "enhancing": BAR_ENHANCING,
+        "typing": BAR_SUCCESS,
+    }
 
     # Animation settings
     NUM_BARS = 5
@@ -29,96 +50,174 @@ class RecordingOverlay:
     MIN_BAR_HEIGHT = 4
     MAX_BAR_HEIGHT = 20
     ANIMATION_SPEED = 33  # ~30fps
-
-    def __init__(self, position: str = "top-right"):
+    IDLE_FRAME_DELAY = 200  # ms between frames once idle bars have settled
+    COMMAND_EVENT = "<<DitadoCmd>>"
+    TARGET_FPS = 30
+    FRAME_TIME_WINDOW = 10  # Seconds of frame timings used to adapt the interval
+    RECORDING_ANGULAR_SPEED = 6.0   # Radians per second
+    PROCESSING_ANGULAR_SPEED = 3.0  # Radians per second
+    NOISE_RING_SIZE = 4096  # Pregenerated bar noise samples, reused cyclically
+    PROCESSING_PHASES = np.arange(NUM_BARS, dtype=np.float32) * 0.6
+
+    # Bar layout is fixed: left edge of each bar and their shared vertical center
+    BARS_TOTAL_WIDTH = NUM_BARS * BAR_WIDTH + (NUM_BARS - 1) * BAR_GAP
+    BAR_XS = tuple(
+        ((WIDTH - BARS_TOTAL_WIDTH) / 2 + np.arange(NUM_BARS) * (BAR_WIDTH + BAR_GAP)).tolist()
+    )
+    BAR_CENTER_Y = HEIGHT / 2
+
+    # Checkmark line segments (x1, y1, x2, y2), centered with size 10
+    CHECKMARK_SEGMENTS = (
+        (WIDTH / 2 - 6, HEIGHT / 2, WIDTH / 2 - 1, HEIGHT / 2 + 5),
+        (WIDTH / 2 - 1, HEIGHT / 2 + 5, WIDTH / 2 + 7, HEIGHT / 2 - 4),
+    )
+    SPLINE_STEPS = 12  # Curve segments per rounded corner
+    SETTLE_EPSILON = 0.25  # Sub-pixel bar movement that isn't worth a redraw
+
+    def __init__(self, position: str = "top-right", master: Optional[tk.Misc] = None):
         """
         Initialize the recording overlay.
 
         Args:
             position: Screen position (top-left, top-right, bottom-left, bottom-right, bottom-center)
+            master: Existing Tk root to attach to; if omitted, start() creates its own
         """
         self._position = position
-        self._root: Optional[tk.Tk] = None
+        self._master = master
+        self._window: Optional[Union[tk.Tk, tk.Toplevel]] = None
+        self._owns_root = False
         self._canvas: Optional[tk.Canvas] = None
         self._state = "idle"
         self._visible = False
-        self._thread: Optional[threading.Thread] = None
         self._running = False
-        self._update_queue: List[str] = []
+        self._loop_armed = False
+        self._update_queue: "queue.Queue[str]" = queue.Queue()
 
         # Animation state
-        self._animation_frame = 0
-        self._bar_heights: List[float] = [self.MIN_BAR_HEIGHT] * self.NUM_BARS
-        self._bar_targets: List[float] = [self.MIN_BAR_HEIGHT] * self.NUM_BARS
-        self._bar_phases: List[float] = [i * 0.8 for i in range(self.NUM_BARS)]
+        self._start_time = time.monotonic()
+        self._elapsed = 0.0
+        self._net_delays: deque = deque(maxlen=self.TARGET_FPS * self.FRAME_TIME_WINDOW)
+        self._net_delay_total = 0.0
+        self._bar_heights = np.full(self.NUM_BARS, self.MIN_BAR_HEIGHT, dtype=np.float32)
+        self._bar_targets = np.full(self.NUM_BARS, self.MIN_BAR_HEIGHT, dtype=np.float32)
+        self._bar_phases = np.arange(self.NUM_BARS, dtype=np.float32) * 0.8
+        self._noise = np.random.uniform(-0.15, 0.15, self.NOISE_RING_SIZE).astype(np.float32)
+        self._noise_idx = 0
 
         # Success animation
         self._success_progress = 0.0
 
+        # Per-state animation step
+        self._animators = {
+            "recording": self._animate_recording,
+            "transcribing": self._animate_processing,
+            "processing": self._animate_processing,
+            "enhancing": self._animate_enhancing,
+            "typing": self._animate_success,
+        }
+
+        # Redraw tracking - skip canvas work once bars have settled
+        self._dirty = True
+        self._last_state_drawn: Optional[str] = None
+
+        # Canvas item ids, created once in _build_indicator
+        self._bg_item_id: Optional[int] = None
+        self._bar_item_ids: List[int] = []
+        self._check_item_ids: List[int] = []
+        self._drawn_color: Optional[str] = None
+        self._check_color: Optional[str] = None
+        self._check_visible = False
+
+    def attach(self, master: tk.Misc) -> None:
+        """Set the Tk root to share and start the overlay on it."""
+        self._master = master
+        self.start()
+
     def start(self) -> None:
-        """Start the overlay in a separate thread."""
+        """
+        Build the overlay window.
+
+        Must be called from the thread that runs the Tk event loop. With a
+        master the overlay is a Toplevel sharing that root's interpreter and
+        mainloop; without one it creates its own root, and the calling thread
+        must pump the event loop (mainloop() or periodic update()). Other
+        threads only enqueue commands via show()/hide()/set_state()/set_position().
+        """
         if self._running:
             return
 
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._owns_root = self._master is None
+        self._build(tk.Tk() if self._owns_root else tk.Toplevel(self._master))
 
     def stop(self) -> None:
-        """Stop the overlay and destroy its Tkinter instance."""
+        """Stop the overlay and destroy its window."""
         self._running = False
-        if self._root:
+        if self._window:
             try:
-                self._root.quit()
-                self._root.destroy()
+                if self._owns_root:
+                    self._window.quit()
+                self._window.destroy()
             except Exception:
                 pass
-            self._root = None
+            self._window = None
 
     def show(self) -> None:
         """Show the overlay."""
-        self._update_queue.append("show")
+        self._post("show")
 
     def hide(self) -> None:
         """Hide the overlay."""
-        self._update_queue.append("hide")
+        self._post("hide")
 
     def set_state(self, state: str) -> None:
         """Set the overlay state (idle, recording, transcribing, enhancing, typing)."""
-        self._update_queue.append(f"state:{state}")
+        self._post(f"state:{state}")
 
     def set_position(self, position: str) -> None:
         """Set the corner position."""
         self._position = position
-        self._update_queue.append("reposition")
-
-    def _run(self) -> None:
-        """Run the Tkinter mainloop in a separate thread."""
-        self._root = tk.Tk()
-        self._root.title("Ditado")
-        self._root.overrideredirect(True)
-        self._root.attributes("-topmost", True)
-        self._root.attributes("-alpha", 0.95)
-        self._root.withdraw()
+        self._post("reposition")
+
+    def _post(self, cmd: str) -> None:
+        """Queue a command and wake the Tk loop to process it."""
+        self._update_queue.put(cmd)
+        window = self._window
+        if window is None:
+            return  # Drained once the overlay window is built
+        try:
+            window.event_generate(self.COMMAND_EVENT, when="tail")
+        except (tk.TclError, RuntimeError):
+            pass  # Window not ready or already destroyed
+
+    def _build(self, window: Union[tk.Tk, tk.Toplevel]) -> None:
+        """Configure the overlay window and its canvas (on the Tk thread)."""
+        self._window = window
+        self._window.bind(self.COMMAND_EVENT, self._process_commands)
+        self._window.title("Ditado")
+        self._window.overrideredirect(True)
+        self._window.attributes("-topmost", True)
+        self._window.attributes("-alpha", 0.95)
+        self._window.withdraw()
 
         # Set window icon (300ms delay to override CustomTkinter's default at 200ms)
         try:
-            from .tray import get_asset_path
-            icon_path = get_asset_path("icon.ico")
-            self._root.after(300, lambda: self._root.iconbitmap(icon_path))
+            from ._assets import asset_path
+            icon_path = asset_path("icon.ico")
+            self._window.after(300, lambda: self._window.iconbitmap(icon_path))
         except Exception:
             pass
 
         # Transparent window background
-        self._root.configure(bg='black')
+        self._window.configure(bg='black')
         try:
-            self._root.attributes("-transparentcolor", "black")
+            self._window.attributes("-transparentcolor", "black")
         except Exception:
             pass
 
         # Create canvas with transparent background
         self._canvas = tk.Canvas(
-            self._root,
+            self._window,
             width=self.WIDTH,
             height=self.HEIGHT,
             bg="black",
@@ -126,102 +225,145 @@ class RecordingOverlay:
         )
         self._canvas.pack()
 
-        # Initial draw and position
-        self._draw_indicator()
+        # Build canvas items once and position
+        self._build_indicator()
         self._update_position()
 
-        # Start animation loop
-        self._root.after(self.ANIMATION_SPEED, self._animation_loop)
-        self._root.mainloop()
+        # Drain anything queued before the window existed; "show" starts the
+        # animation loop
+        self._window.after(0, self._process_commands)
 
     def _animation_loop(self) -> None:
-        """Main animation loop."""
-        if not self._running:
+        """Main animation loop - only armed while the overlay is visible."""
+        if not self._running or not self._visible or not self._window:
+            # Stay disarmed until the next "show" command
+            self._loop_armed = False
             return
 
-        # Process command queue
-        self._process_commands()
-
-        # Animate if visible
-        if self._visible:
-            self._update_animation()
-            self._draw_indicator()
-
-        # Schedule next frame
-        if self._running and self._root:
-            self._root.after(self.ANIMATION_SPEED, self._animation_loop)
-
-    def _process_commands(self) -> None:
-        """Process queued commands."""
-        while self._update_queue:
-            cmd = self._update_queue.pop(0)
-
-            if cmd == "show":
-                self._root.deiconify()
-                self._visible = True
-                self._animation_frame = 0
-                self._success_progress = 0.0
-            elif cmd == "hide":
-                self._root.withdraw()
-                self._visible = False
+        # Animate, redrawing only when something changed
+        frame_start = time.perf_counter()
+        self._update_animation()
+        if self._dirty:
+            self._update_indicator()
+        self._record_net_delay(time.perf_counter() - frame_start)
+
+        # Schedule next frame, dropping the rate once idle bars have settled
+        if self._state == "idle" and not self._dirty:
+            delay = self.IDLE_FRAME_DELAY
+        else:
+            delay = self._next_frame_delay()
+        self._window.after(delay, self._animation_loop)
+
+    def _record_net_delay(self, net_delay: float) -> None:
+        """Track how long frame work takes over the recent window."""
+        if len(self._net_delays) == self._net_delays.maxlen:
+            self._net_delay_total -= self._net_delays[0]
+        self._net_delays.append(net_delay)
+        self._net_delay_total += net_delay
+
+    def _next_frame_delay(self) -> int:
+        """Get the next frame interval in ms, net of the average frame work."""
+        if not self._net_delays:
+            return self.ANIMATION_SPEED
+        mean_delay = self._net_delay_total / len(self._net_delays)
+        return max(1, int(1000 / self.TARGET_FPS - mean_delay * 1000))
+
+    def _process_commands(self, event: Optional[tk.Event] = None) -> None:
+        """Process queued commands (runs on the Tk thread)."""
+        if not self._window:
+            return
+
+        # Drain everything queued so far, then collapse bursts so only the
+        # final state and visibility are applied
+        new_state: Optional[str] = None
+        visibility: Optional[str] = None
+        reposition = False
+        get_nowait = self._update_queue.get_nowait
+        while True:
+            try:
+                cmd = get_nowait()
+            except queue.Empty:
+                break
+
+            if cmd in ("show", "hide"):
+                visibility = cmd
             elif cmd.startswith("state:"):
-                new_state = cmd.split(":")[1]
-                if new_state != self._state:
-                    self._state = new_state
-                    self._success_progress = 0.0
+                new_state = cmd.partition(":")[2]
             elif cmd == "reposition":
-                self._update_position()
+                reposition = True
+
+        if new_state is not None and new_state != self._state:
+            self._state = new_state
+            self._success_progress = 0.0
+
+        if visibility == "show":
+            self._window.deiconify()
+            self._visible = True
+            self._start_time = time.monotonic()
+            self._success_progress = 0.0
+            self._last_state_drawn = None  # Force a full redraw on show
+            if not self._loop_armed:
+                self._loop_armed = True
+                self._window.after(0, self._animation_loop)
+        elif visibility == "hide":
+            self._window.withdraw()
+            self._visible = False
+
+        if reposition:
+            self._update_position()
 
     def _update_animation(self) -> None:
         """Update animation based on current state."""
-        self._animation_frame += 1
-
-        if self._state == "recording":
-            self._animate_recording()
-        elif self._state in ("transcribing", "processing"):
-            self._animate_processing()
-        elif self._state == "enhancing":
-            self._animate_enhancing()
-        elif self._state == "typing":
-            self._animate_success()
-        else:
-            # Idle - bars at minimum
-            for i in range(self.NUM_BARS):
-                self._bar_targets[i] = self.MIN_BAR_HEIGHT
+        self._elapsed = time.monotonic() - self._start_time
+
+        self._animators.get(self._state, self._animate_idle)()
 
         # Smooth interpolation of bar heights
         self._interpolate_bars()
 
+        # Only redraw if bars moved perceptibly or the state changed
+        max_delta = float(np.abs(self._bar_targets - self._bar_heights).max())
+        success_animating = self._state == "typing" and self._success_progress < 1.0
+        self._dirty = (
+            max_delta >= self.SETTLE_EPSILON
+            or self._state != self._last_state_drawn
+            or success_animating
+        )
+
+    def _animate_idle(self) -> None:
+        """Idle - bars at minimum."""
+        self._bar_targets.fill(self.MIN_BAR_HEIGHT)
+
     def _animate_recording(self) -> None:
         """Animate soundwave bars during recording - energetic, random."""
-        for i in range(self.NUM_BARS):
-            # Sine wave base + randomness for natural feel
-            phase = self._animation_frame * 0.2 + self._bar_phases[i]
-            base = (math.sin(phase) + 1) / 2
-
-            # Add some randomness
-            noise = random.uniform(-0.15, 0.15)
-            height_ratio = base + noise
-
-            # Clamp and scale
-            height_ratio = max(0.2, min(1.0, height_ratio))
-            self._bar_targets[i] = (
-                self.MIN_BAR_HEIGHT +
-                height_ratio * (self.MAX_BAR_HEIGHT - self.MIN_BAR_HEIGHT)
-            )
+        # Sine wave base + randomness for natural feel
+        ratio = np.sin(self._elapsed * self.RECORDING_ANGULAR_SPEED + self._bar_phases)
+        ratio += 1
+        ratio *= 0.5
+        ratio += self._next_noise()
+
+        # Clamp and scale
+        np.clip(ratio, 0.2, 1.0, out=ratio)
+        self._bar_targets[:] = (
+            self.MIN_BAR_HEIGHT + ratio * (self.MAX_BAR_HEIGHT - self.MIN_BAR_HEIGHT)
+        )
+
+    def _next_noise(self) -> np.ndarray:
+        """Get the next frame's bar noise as a view into the noise ring."""
+        idx = self._noise_idx
+        self._noise_idx = (idx + self.NUM_BARS) % (self.NOISE_RING_SIZE - self.NUM_BARS)
+        return self._noise[idx:idx + self.NUM_BARS]
 
     def _animate_processing(self) -> None:
         """Animate wave effect during processing - slower, wave-like."""
-        for i in range(self.NUM_BARS):
-            # Slower sine wave, sequential phase
-            phase = self._animation_frame * 0.1 + i * 0.6
-            base = (math.sin(phase) + 1) / 2
-
-            height_ratio = 0.3 + base * 0.5  # More subtle range
-            self._bar_targets[i] = (
-                self.MIN_BAR_HEIGHT +
-                height_ratio * (self.MAX_BAR_HEIGHT - self.MIN_BAR_HEIGHT)
-            )
+        # Slower sine wave, sequential phase
+        ratio = np.sin(self._elapsed * self.PROCESSING_ANGULAR_SPEED + self.PROCESSING_PHASES)
+        ratio += 1
+        ratio *= 0.25  # More subtle range: 0.3 + base * 0.5
+        ratio += 0.3
+        self._bar_targets[:] = (
+            self.MIN_BAR_HEIGHT + ratio * (self.MAX_BAR_HEIGHT - self.MIN_BAR_HEIGHT)
+        )
 
     def _animate_enhancing(self) -> None:
         """Animate during enhancement - similar to processing but different color."""
@@ -233,25 +375,22 @@ class RecordingOverlay:
 
         # Bars collapse down
         collapse_ratio = 1.0 - self._success_progress
-        for i in range(self.NUM_BARS):
-            self._bar_targets[i] = self.MIN_BAR_HEIGHT + collapse_ratio * (
-                self._bar_heights[i] - self.MIN_BAR_HEIGHT
-            )
+        self._bar_targets[:] = self.MIN_BAR_HEIGHT + collapse_ratio * (
+            self._bar_heights - self.MIN_BAR_HEIGHT
+        )
 
     def _interpolate_bars(self) -> None:
         """Smoothly interpolate bar heights toward targets."""
         lerp_speed = 0.3  # Interpolation speed
-        for i in range(self.NUM_BARS):
-            diff = self._bar_targets[i] - self._bar_heights[i]
-            self._bar_heights[i] += diff * lerp_speed
+        self._bar_heights += (self._bar_targets - self._bar_heights) * lerp_speed
 
     def _update_position(self) -> None:
         """Update window position based on position setting."""
-        if not self._root:
+        if not self._window:
             return
 
-        screen_width = self._root.winfo_screenwidth()
-        screen_height = self._root.winfo_screenheight()
+        screen_width = self._window.winfo_screenwidth()
+        screen_height = self._window.winfo_screenheight()
 
         padding = 20
         taskbar_height = 40  # Account for Windows taskbar
@@ -273,159 +412,141 @@ class RecordingOverlay:
             x = screen_width - self.WIDTH - padding
             y = screen_height - self.HEIGHT - padding - taskbar_height
 
-        self._root.geometry(f"{self.WIDTH}x{self.HEIGHT}+{x}+{y}")
+        self._window.geometry(f"{self.WIDTH}x{self.HEIGHT}+{x}+{y}")
 
-    def _draw_indicator(self) -> None:
-        """Draw the indicator based on current state."""
+    def _build_indicator(self) -> None:
+        """Create the canvas items once; per-frame updates only mutate them."""
         if not self._canvas:
             return
 
-        self._canvas.delete("all")
-
-        # Draw pill-shaped background
-        self._draw_rounded_rect(
+        # Pill-shaped background (static)
+        self._bg_item_id = self._draw_rounded_rect(
             0, 0, self.WIDTH, self.HEIGHT,
             self.CORNER_RADIUS, self.BG_COLOR
         )
 
-        # Get bar color based on state
-        if self._state == "recording":
-            bar_color = self.BAR_RECORDING
-        elif self._state in ("transcribing", "processing"):
-            bar_color = self.BAR_PROCESSING
-        elif self._state == "enhancing":
-            bar_color = self.BAR_ENHANCING
-        elif self._state == "typing":
-            bar_color = self.BAR_SUCCESS
-        else:
-            bar_color = "#555555"  # Idle gray
-
-        # Draw soundwave bars or checkmark
-        if self._state == "typing" and self._success_progress > 0.7:
-            # Draw checkmark when bars have collapsed
-            self._draw_checkmark(bar_color)
-        else:
-            # Draw soundwave bars
-            self._draw_soundwave_bars(bar_color)
-
-    def _draw_soundwave_bars(self, color: str) -> None:
-        """Draw the animated soundwave bars."""
-        # Calculate total width of bars
-        total_width = (
-            self.NUM_BARS * self.BAR_WIDTH +
-            (self.NUM_BARS - 1) * self.BAR_GAP
-        )
-        start_x = (self.WIDTH - total_width) / 2
-        center_y = self.HEIGHT / 2
-
+        # Soundwave bars - moved via coords() each frame
+        self._bar_item_ids = []
         for i in range(self.NUM_BARS):
-            x = start_x + i * (self.BAR_WIDTH + self.BAR_GAP)
-            height = self._bar_heights[i]
-            y1 = center_y - height / 2
-            y2 = center_y + height / 2
-
-            # Draw rounded bar
-            self._draw_rounded_rect(
-                x, y1, x + self.BAR_WIDTH, y2,
-                self.BAR_WIDTH / 2, color
+            x1, y1, x2, y2 = self._bar_bounds(i)
+            self._bar_item_ids.append(self._draw_rounded_rect(
+                x1, y1, x2, y2, self.BAR_WIDTH / 2, self.IDLE_COLOR
+            ))
+
+        # Checkmark lines - hidden until the success animation reaches them
+        self._check_item_ids = [
+            self._canvas.create_line(
+                *segment, fill=self.BAR_SUCCESS, width=3, capstyle="round", state="hidden"
             )
+            for segment in self.CHECKMARK_SEGMENTS
+        ]
 
-    def _draw_checkmark(self, color: str) -> None:
-        """Draw a checkmark icon."""
-        cx = self.WIDTH / 2
-        cy = self.HEIGHT / 2
-        size = 10
-
-        # Checkmark path
-        self._canvas.create_line(
-            cx - size * 0.6, cy,
-            cx - size * 0.1, cy + size * 0.5,
-            fill=color, width=3, capstyle="round"
-        )
-        self._canvas.create_line(
-            cx - size * 0.1, cy + size * 0.5,
-            cx + size * 0.7, cy - size * 0.4,
-            fill=color, width=3, capstyle="round"
+        self._drawn_color = self.IDLE_COLOR
+        self._check_color = self.BAR_SUCCESS
+        self._check_visible = False
+
+    def _update_indicator(self) -> None:
+        """Update the existing canvas items to reflect the current state."""
+        if not self._canvas or not self._bar_item_ids:
+            return
+
+        self._last_state_drawn = self._state
+
+        bar_color = self.STATE_COLORS.get(self._state, self.IDLE_COLOR)
+
+        # Show checkmark when bars have collapsed, soundwave bars otherwise
+        show_check = self._state == "typing" and self._success_progress > 0.7
+        if show_check != self._check_visible:
+            bar_state = "hidden" if show_check else "normal"
+            check_state = "normal" if show_check else "hidden"
+            for bar_id in self._bar_item_ids:
+                self._canvas.itemconfig(bar_id, state=bar_state)
+            for line_id in self._check_item_ids:
+                self._canvas.itemconfig(line_id, state=check_state)
+            self._check_visible = show_check
+
+        if show_check:
+            # Lines are static; only recolor if the color actually changed
+            if bar_color != self._check_color:
+                for line_id in self._check_item_ids:
+                    self._canvas.itemconfig(line_id, fill=bar_color)
+                self._check_color = bar_color
+        else:
+            if bar_color != self._drawn_color:
+                for bar_id in self._bar_item_ids:
+                    self._canvas.itemconfig(bar_id, fill=bar_color, outline=bar_color)
+                self._drawn_color = bar_color
+
+            # Only the heights change per frame; the layout is class-level
+            coords = self._canvas.coords
+            points = self._rounded_rect_points
+            bar_width = self.BAR_WIDTH
+            radius = bar_width / 2
+            center_y = self.BAR_CENTER_Y
+            for bar_id, x, height in zip(
+                self._bar_item_ids, self.BAR_XS, self._bar_heights.tolist()
+            ):
+                half_height = height / 2
+                coords(bar_id, points(
+                    x, center_y - half_height, x + bar_width, center_y + half_height, radius
+                ))
+
+    def _bar_bounds(self, i: int) -> tuple:
+        """Get the bounding box of bar i at its current height."""
+        x = self.BAR_XS[i]
+        half_height = float(self._bar_heights[i]) / 2
+        return (
+            x, self.BAR_CENTER_Y - half_height,
+            x + self.BAR_WIDTH, self.BAR_CENTER_Y + half_height,
         )
 
-    def _draw_rounded_rect(
-        self, x1: float, y1: float, x2: float, y2: float,
-        radius: float, color: str
-    ) -> None:
-        """Draw a rounded rectangle using canvas arcs and polygons."""
+    def _rounded_rect_points(
+        self, x1: float, y1: float, x2: float, y2: float, radius: float
+    ) -> List[float]:
+        """
+        Get the control points for a smoothed rounded-rectangle polygon.
+
+        Each edge endpoint is doubled so Tk's spline passes through it and
+        keeps the edges straight; the single corner points act as the
+        Bezier control for the rounded corners.
+        """
         # Ensure minimum dimensions
         width = x2 - x1
         height = y2 - y1
         radius = min(radius, width / 2, height / 2)
 
-        # Create rounded rectangle using multiple shapes
-        points = []
-
-        # Top side
-        points.extend([x1 + radius, y1])
-        points.extend([x2 - radius, y1])
-
-        # Top-right corner
-        points.extend([x2, y1])
-        points.extend([x2, y1 + radius])
-
-        # Right side
-        points.extend([x2, y2 - radius])
+        return [
+            # Top side
+            x1 + radius, y1, x1 + radius, y1,
+            x2 - radius, y1, x2 - radius, y1,
+            # Top-right corner
+            x2, y1,
+            # Right side
+            x2, y1 + radius, x2, y1 + radius,
+            x2, y2 - radius, x2, y2 - radius,
+            # Bottom-right corner
+            x2, y2,
+            # Bottom side
+            x2 - radius, y2, x2 - radius, y2,
+            x1 + radius, y2, x1 + radius, y2,
+            # Bottom-left corner
+            x1, y2,
+            # Left side
+            x1, y2 - radius, x1, y2 - radius,
+            x1, y1 + radius, x1, y1 + radius,
+            # Top-left corner
+            x1, y1,
+        ]
 
-        # Bottom-right corner
-        points.extend([x2, y2])
-        points.extend([x2 - radius, y2])
-
-        # Bottom side
-        points.extend([x1 + radius, y2])
-
-        # Bottom-left corner
-        points.extend([x1, y2])
-        points.extend([x1, y2 - radius])
-
-        # Left side
-        points.extend([x1, y1 + radius])
-
-        # Top-left corner
-        points.extend([x1, y1])
-        points.extend([x1 + radius, y1])
-
-        # Draw as smooth polygon
-        self._canvas.create_polygon(
-            points,
+    def _draw_rounded_rect(
+        self, x1: float, y1: float, x2: float, y2: float,
+        radius: float, color: str
+    ) -> int:
+        """Draw a rounded rectangle as a single smoothed polygon, returning its item id."""
+        return self._canvas.create_polygon(
+            self._rounded_rect_points(x1, y1, x2, y2, radius),
             fill=color,
             outline=color,
             smooth=True,
-        )
-
-        # Draw corner arcs for smoother corners
-        # Top-left
-        self._canvas.create_arc(
-            x1, y1, x1 + radius * 2, y1 + radius * 2,
-            start=90, extent=90, fill=color, outline=color
-        )
-        # Top-right
-        self._canvas.create_arc(
-            x2 - radius * 2, y1, x2, y1 + radius * 2,
-            start=0, extent=90, fill=color, outline=color
-        )
-        # Bottom-right
-        self._canvas.create_arc(
-            x2 - radius * 2, y2 - radius * 2, x2, y2,
-            start=270, extent=90, fill=color, outline=color
-        )
-        # Bottom-left
-        self._canvas.create_arc(
-            x1, y2 - radius * 2, x1 + radius * 2, y2,
-            start=180, extent=90, fill=color, outline=color
-        )
-
-        # Fill center rectangles
-        self._canvas.create_rectangle(
-            x1 + radius, y1, x2 - radius, y2,
-            fill=color, outline=color
-        )
-        self._canvas.create_rectangle(
-            x1, y1 + radius, x2, y2 - radius,
-            fill=color, outline=color
+            splinesteps=self.SPLINE_STEPS,
         )
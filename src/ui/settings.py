@@ -1,24 +1,46 @@
 """Settings window for Ditado."""
 
-import os
-import sys
+from functools import lru_cache
 import customtkinter as ctk
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from ..config.settings import Settings
 from ..transcription.whisper import SUPPORTED_LANGUAGES
 from ..input.hotkey import KeyCaptureDialog
 from ..audio.recorder import list_audio_devices, get_default_input_device
+from ._assets import asset_path as get_asset_path
 
 
-def get_asset_path(filename: str) -> str:
-    """Get the path to an asset file, works for both dev and bundled exe."""
-    if getattr(sys, 'frozen', False):
-        # Running as bundled exe
-        base_path = sys._MEIPASS
-    else:
-        # Running in development
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    return os.path.join(base_path, "assets", filename)
+# Language menu entries, formatted once as "code: name"
+_LANG_OPTIONS = tuple(f"{code}: {name}" for code, name in SUPPORTED_LANGUAGES.items())
+_LANG_LABEL_BY_CODE = dict(zip(SUPPORTED_LANGUAGES, _LANG_OPTIONS))
+
+# Max recording duration menu entries and their values in seconds
+_DURATION_OPTIONS = ("1 min", "2 min", "5 min", "10 min", "15 min", "No limit")
+_DURATION_VALUES = {
+    "1 min": 60,
+    "2 min": 120,
+    "5 min": 300,
+    "10 min": 600,
+    "15 min": 900,
+    "No limit": 0,
+}
+_SECONDS_TO_NAME = {seconds: name for name, seconds in _DURATION_VALUES.items()}
+
+# Bound formatters for the Usage tab values
+_fmt_money = "${:.4f}".format
+_fmt_min = "{:.2f}".format
+
+
+@lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Get a shared font; must first be called after the Tk root exists."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+@lru_cache(maxsize=1)
+def _cached_devices() -> Tuple[dict, ...]:
+    """Get input devices, enumerated once until the cache is cleared."""
+    return tuple(list_audio_devices())
 
 
 class SettingsWindow:
@@ -32,7 +54,16 @@ class SettingsWindow:
         self._settings = settings
         self._on_save = on_save
         self._window: Optional[ctk.CTkToplevel] = None
+        self._tabview: Optional[ctk.CTkTabview] = None
         self._capturing_hotkey = False
+        self._mic_testing = False
+        self._api_testing = False
+        self._tab_builders: Dict[str, Callable[[ctk.CTkFrame], None]] = {
+            "General": self._build_general_tab,
+            "API": self._build_api_tab,
+            "Usage": self._build_usage_tab,
+        }
+        self._built_tabs: Set[str] = set()
 
         # Set appearance
         ctk.set_appearance_mode("dark")
@@ -41,6 +72,10 @@ class SettingsWindow:
     def show(self, parent: Optional[ctk.CTk] = None) -> None:
         """Show the settings window."""
         if self._window is not None and self._window.winfo_exists():
+            # Reuse the hidden window; only reload values and transient state
+            if self._window.state() == "withdrawn":
+                self._reset_form()
+                self._window.deiconify()
             self._window.focus()
             return
 
@@ -53,6 +88,7 @@ class SettingsWindow:
         self._window.title("Ditado Settings")
         self._window.geometry("500x750")
         self._window.resizable(False, False)
+        self._window.protocol("WM_DELETE_WINDOW", self.close)
 
         # Set window icon (300ms delay to override CustomTkinter's default at 200ms)
         try:
@@ -69,23 +105,19 @@ class SettingsWindow:
         title = ctk.CTkLabel(
             container,
             text="Ditado Settings",
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=_font(24, "bold"),
         )
         title.pack(pady=(0, 20))
 
         # Create tabview
-        tabview = ctk.CTkTabview(container)
-        tabview.pack(fill="both", expand=True)
+        self._tabview = ctk.CTkTabview(container, command=self._on_tab_changed)
+        self._tabview.pack(fill="both", expand=True)
 
-        # Add tabs
-        tab_general = tabview.add("General")
-        tab_api = tabview.add("API")
-        tab_usage = tabview.add("Usage")
-
-        # Build each tab
-        self._build_general_tab(tab_general)
-        self._build_api_tab(tab_api)
-        self._build_usage_tab(tab_usage)
+        # Add tabs; contents are built on first selection
+        self._built_tabs.clear()
+        for name in self._tab_builders:
+            self._tabview.add(name)
+        self._build_tab("General")
 
         # Save button
         save_btn = ctk.CTkButton(
@@ -93,10 +125,22 @@ class SettingsWindow:
             text="Save Settings",
             command=self._save,
             height=40,
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
         )
         save_btn.pack(pady=(20, 0), fill="x")
 
+    def _on_tab_changed(self) -> None:
+        """Build the selected tab the first time it is shown."""
+        if self._tabview is not None:
+            self._build_tab(self._tabview.get())
+
+    def _build_tab(self, name: str) -> None:
+        """Build a tab's widgets once."""
+        if name in self._built_tabs or self._tabview is None:
+            return
+        self._built_tabs.add(name)
+        self._tab_builders[name](self._tabview.tab(name))
+
     def _build_general_tab(self, parent: ctk.CTkFrame) -> None:
         """Build the General settings tab."""
         # Hotkey section
@@ -106,7 +150,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             hotkey_frame,
             text="Push-to-Talk Hotkey",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         hotkey_row = ctk.CTkFrame(hotkey_frame, fg_color="transparent")
@@ -136,18 +180,18 @@ class SettingsWindow:
         ctk.CTkLabel(
             lang_frame,
             text="Dictation Language",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
-        # Create language options
-        lang_options = [f"{code}: {name}" for code, name in SUPPORTED_LANGUAGES.items()]
-        current_lang = f"{self._settings.language}: {SUPPORTED_LANGUAGES.get(self._settings.language, 'Unknown')}"
+        current_lang = _LANG_LABEL_BY_CODE.get(
+            self._settings.language, f"{self._settings.language}: Unknown"
+        )
 
         self._lang_var = ctk.StringVar(value=current_lang)
         self._lang_menu = ctk.CTkOptionMenu(
             lang_frame,
             variable=self._lang_var,
-            values=lang_options,
+            values=list(_LANG_OPTIONS),
             width=250,
         )
         self._lang_menu.pack(anchor="w", padx=10, pady=(0, 10))
@@ -159,7 +203,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             pos_frame,
             text="Indicator Position",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         positions = ["top-left", "top-right", "bottom-left", "bottom-right"]
@@ -179,45 +223,46 @@ class SettingsWindow:
         ctk.CTkLabel(
             audio_frame,
             text="Microphone",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         # Get available audio devices
-        self._audio_devices = list_audio_devices()
-        device_names = ["System Default"]
-        for device in self._audio_devices:
-            device_names.append(f"{device['name']}")
-
-        # Find current selection
-        current_device = "System Default"
-        if self._settings.audio_device_index is not None:
-            for device in self._audio_devices:
-                if device["index"] == self._settings.audio_device_index:
-                    current_device = device["name"]
-                    break
-
-        self._audio_device_var = ctk.StringVar(value=current_device)
+        self._set_devices(_cached_devices())
+        device_names = self._device_names()
+
+        device_row = ctk.CTkFrame(audio_frame, fg_color="transparent")
+        device_row.pack(fill="x", padx=10, pady=(0, 5))
+
+        self._audio_device_var = ctk.StringVar(value=self._current_device_name())
         self._audio_device_menu = ctk.CTkOptionMenu(
-            audio_frame,
+            device_row,
             variable=self._audio_device_var,
             values=device_names,
-            width=350,
+            width=290,
         )
-        self._audio_device_menu.pack(anchor="w", padx=10, pady=(0, 5))
+        self._audio_device_menu.pack(side="left", padx=(0, 10))
+
+        refresh_btn = ctk.CTkButton(
+            device_row,
+            text="Refresh devices",
+            command=self._refresh_devices,
+            width=100,
+        )
+        refresh_btn.pack(side="left")
 
         # Test microphone button
-        test_mic_btn = ctk.CTkButton(
+        self._test_mic_btn = ctk.CTkButton(
             audio_frame,
             text="Test Microphone",
             command=self._test_microphone,
             width=120,
         )
-        test_mic_btn.pack(anchor="w", padx=10, pady=(0, 5))
+        self._test_mic_btn.pack(anchor="w", padx=10, pady=(0, 5))
 
         self._mic_status = ctk.CTkLabel(
             audio_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
         )
         self._mic_status.pack(anchor="w", padx=10, pady=(0, 10))
 
@@ -228,7 +273,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             limits_frame,
             text="Recording Limits",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         # Max recording duration
@@ -238,34 +283,16 @@ class SettingsWindow:
         ctk.CTkLabel(
             duration_row,
             text="Max duration:",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
         ).pack(side="left")
 
-        # Convert seconds to minutes for display
-        duration_options = ["1 min", "2 min", "5 min", "10 min", "15 min", "No limit"]
-        duration_values = {
-            "1 min": 60,
-            "2 min": 120,
-            "5 min": 300,
-            "10 min": 600,
-            "15 min": 900,
-            "No limit": 0,
-        }
-
-        # Find current value
-        current_duration = "5 min"  # default
-        for name, seconds in duration_values.items():
-            if seconds == self._settings.max_recording_seconds:
-                current_duration = name
-                break
-        if self._settings.max_recording_seconds == 0:
-            current_duration = "No limit"
+        current_duration = _SECONDS_TO_NAME.get(self._settings.max_recording_seconds, "5 min")
 
         self._duration_var = ctk.StringVar(value=current_duration)
         self._duration_menu = ctk.CTkOptionMenu(
             duration_row,
             variable=self._duration_var,
-            values=duration_options,
+            values=list(_DURATION_OPTIONS),
             width=120,
         )
         self._duration_menu.pack(side="left", padx=(10, 0))
@@ -276,13 +303,10 @@ class SettingsWindow:
             limits_frame,
             text="Auto-stop when limit reached",
             variable=self._auto_stop_var,
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
         )
         auto_stop_switch.pack(anchor="w", padx=10, pady=(5, 10))
 
-        # Store duration values for save
-        self._duration_values = duration_values
-
         # AI Enhancement toggle
         enhance_frame = ctk.CTkFrame(parent)
         enhance_frame.pack(fill="x", pady=10)
@@ -292,14 +316,14 @@ class SettingsWindow:
             enhance_frame,
             text="AI Text Enhancement (GPT cleanup)",
             variable=self._enhance_var,
-            font=ctk.CTkFont(size=14),
+            font=_font(14),
         )
         enhance_switch.pack(anchor="w", padx=10, pady=10)
 
         ctk.CTkLabel(
             enhance_frame,
             text="Removes filler words and fixes grammar",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
             text_color="gray",
         ).pack(anchor="w", padx=10, pady=(0, 10))
 
@@ -312,7 +336,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             key_frame,
             text="OpenAI API Key",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         self._api_key_var = ctk.StringVar(value=self._settings.api_key)
@@ -337,18 +361,18 @@ class SettingsWindow:
         self._show_key_btn.pack(anchor="w", padx=10, pady=(0, 10))
 
         # Test connection button
-        test_btn = ctk.CTkButton(
+        self._test_api_btn = ctk.CTkButton(
             key_frame,
             text="Test Connection",
             command=self._test_api,
             width=120,
         )
-        test_btn.pack(anchor="w", padx=10, pady=(0, 10))
+        self._test_api_btn.pack(anchor="w", padx=10, pady=(0, 10))
 
         self._api_status = ctk.CTkLabel(
             key_frame,
             text="",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
         )
         self._api_status.pack(anchor="w", padx=10, pady=(0, 10))
 
@@ -359,14 +383,14 @@ class SettingsWindow:
         ctk.CTkLabel(
             models_frame,
             text="Models",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
         # Whisper model
         ctk.CTkLabel(
             models_frame,
             text="Transcription Model:",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
         ).pack(anchor="w", padx=10, pady=(5, 0))
 
         self._whisper_var = ctk.StringVar(value=self._settings.whisper_model)
@@ -382,7 +406,7 @@ class SettingsWindow:
         ctk.CTkLabel(
             models_frame,
             text="Enhancement Model:",
-            font=ctk.CTkFont(size=12),
+            font=_font(12),
         ).pack(anchor="w", padx=10, pady=(5, 0))
 
         self._gpt_var = ctk.StringVar(value=self._settings.gpt_model)
@@ -396,8 +420,8 @@ class SettingsWindow:
 
     def _build_usage_tab(self, parent: ctk.CTkFrame) -> None:
         """Build the Usage statistics tab."""
-        stats = self._settings.stats
-        costs = self._settings.get_estimated_cost()
+        # Value labels are kept and refreshed in place by _update_usage
+        self._usage_labels: Dict[str, ctk.CTkLabel] = {}
 
         # Session stats
         session_frame = ctk.CTkFrame(parent)
@@ -406,20 +430,20 @@ class SettingsWindow:
         ctk.CTkLabel(
             session_frame,
             text="This Session",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
-        ctk.CTkLabel(
+        self._usage_labels["session_requests"] = ctk.CTkLabel(
             session_frame,
-            text=f"Transcriptions: {stats.session_requests}",
-            font=ctk.CTkFont(size=12),
-        ).pack(anchor="w", padx=10)
+            font=_font(12),
+        )
+        self._usage_labels["session_requests"].pack(anchor="w", padx=10)
 
-        ctk.CTkLabel(
+        self._usage_labels["session_minutes"] = ctk.CTkLabel(
             session_frame,
-            text=f"Minutes: {stats.session_minutes:.2f}",
-            font=ctk.CTkFont(size=12),
-        ).pack(anchor="w", padx=10, pady=(0, 10))
+            font=_font(12),
+        )
+        self._usage_labels["session_minutes"].pack(anchor="w", padx=10, pady=(0, 10))
 
         # Total stats
         total_frame = ctk.CTkFrame(parent)
@@ -428,20 +452,20 @@ class SettingsWindow:
         ctk.CTkLabel(
             total_frame,
             text="All Time",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
-        ctk.CTkLabel(
+        self._usage_labels["total_requests"] = ctk.CTkLabel(
             total_frame,
-            text=f"Transcriptions: {stats.total_requests}",
-            font=ctk.CTkFont(size=12),
-        ).pack(anchor="w", padx=10)
+            font=_font(12),
+        )
+        self._usage_labels["total_requests"].pack(anchor="w", padx=10)
 
-        ctk.CTkLabel(
+        self._usage_labels["total_minutes"] = ctk.CTkLabel(
             total_frame,
-            text=f"Minutes: {stats.total_minutes:.2f}",
-            font=ctk.CTkFont(size=12),
-        ).pack(anchor="w", padx=10, pady=(0, 10))
+            font=_font(12),
+        )
+        self._usage_labels["total_minutes"].pack(anchor="w", padx=10, pady=(0, 10))
 
         # Cost estimates
         cost_frame = ctk.CTkFrame(parent)
@@ -450,36 +474,106 @@ class SettingsWindow:
         ctk.CTkLabel(
             cost_frame,
             text="Estimated Costs",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
         ).pack(anchor="w", padx=10, pady=(10, 5))
 
-        ctk.CTkLabel(
+        self._usage_labels["whisper_cost"] = ctk.CTkLabel(
             cost_frame,
-            text=f"Whisper: ${costs['whisper']:.4f}",
-            font=ctk.CTkFont(size=12),
-        ).pack(anchor="w", padx=10)
+            font=_font(12),
+        )
+        self._usage_labels["whisper_cost"].pack(anchor="w", padx=10)
 
-        ctk.CTkLabel(
+        self._usage_labels["gpt_cost"] = ctk.CTkLabel(
             cost_frame,
-            text=f"GPT Enhancement: ${costs['gpt']:.4f}",
-            font=ctk.CTkFont(size=12),
-        ).pack(anchor="w", padx=10)
+            font=_font(12),
+        )
+        self._usage_labels["gpt_cost"].pack(anchor="w", padx=10)
 
-        ctk.CTkLabel(
+        self._usage_labels["total_cost"] = ctk.CTkLabel(
             cost_frame,
-            text=f"Total: ${costs['total']:.4f}",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=_font(14, "bold"),
             text_color="#4CAF50",
-        ).pack(anchor="w", padx=10, pady=(5, 10))
+        )
+        self._usage_labels["total_cost"].pack(anchor="w", padx=10, pady=(5, 10))
 
         # Info
         ctk.CTkLabel(
             parent,
             text="Whisper: $0.006/min | GPT-4o-mini: ~$0.0003/request",
-            font=ctk.CTkFont(size=11),
+            font=_font(11),
             text_color="gray",
         ).pack(anchor="w", padx=10, pady=10)
 
+        self._update_usage()
+
+    def _update_usage(self) -> None:
+        """Refresh the Usage tab values from the current stats."""
+        stats = self._settings.stats
+        costs = self._settings.get_estimated_cost()
+        labels = self._usage_labels
+
+        labels["session_requests"].configure(text=f"Transcriptions: {stats.session_requests}")
+        labels["session_minutes"].configure(text="Minutes: " + _fmt_min(stats.session_minutes))
+        labels["total_requests"].configure(text=f"Transcriptions: {stats.total_requests}")
+        labels["total_minutes"].configure(text="Minutes: " + _fmt_min(stats.total_minutes))
+        labels["whisper_cost"].configure(text="Whisper: " + _fmt_money(costs["whisper"]))
+        labels["gpt_cost"].configure(text="GPT Enhancement: " + _fmt_money(costs["gpt"]))
+        labels["total_cost"].configure(text="Total: " + _fmt_money(costs["total"]))
+
+    def _set_devices(self, devices: Tuple[dict, ...]) -> None:
+        """Store the device list and index it by name and by device index."""
+        self._audio_devices = devices
+        # Reversed so the first device wins when names are duplicated
+        self._device_by_name = {d["name"]: d for d in reversed(devices)}
+        self._device_by_index = {d["index"]: d for d in devices}
+
+    def _current_device_name(self) -> str:
+        """Get the menu entry for the configured audio device."""
+        device = self._device_by_index.get(self._settings.audio_device_index)
+        return device["name"] if device is not None else "System Default"
+
+    def _device_names(self) -> List[str]:
+        """Get the microphone menu entries for the current device list."""
+        return ["System Default"] + [device["name"] for device in self._audio_devices]
+
+    def _refresh_devices(self) -> None:
+        """Re-enumerate audio devices and update the microphone menu."""
+        _cached_devices.cache_clear()
+        self._set_devices(_cached_devices())
+        device_names = self._device_names()
+        self._audio_device_menu.configure(values=device_names)
+        if self._audio_device_var.get() not in device_names:
+            self._audio_device_var.set("System Default")
+
+    def _reset_form(self) -> None:
+        """Reload built tabs from the current settings before re-showing."""
+        s = self._settings
+
+        if self._capturing_hotkey:
+            self._capture_btn.configure(text="Capture Key")
+            self._capturing_hotkey = False
+
+        if "General" in self._built_tabs:
+            self._hotkey_entry.configure(state="normal")
+            self._hotkey_var.set(s.hotkey)
+            self._hotkey_entry.configure(state="readonly")
+            self._lang_var.set(_LANG_LABEL_BY_CODE.get(s.language, f"{s.language}: Unknown"))
+            self._pos_var.set(s.indicator_position)
+            self._audio_device_var.set(self._current_device_name())
+            self._duration_var.set(_SECONDS_TO_NAME.get(s.max_recording_seconds, "5 min"))
+            self._auto_stop_var.set(s.auto_stop_recording)
+            self._enhance_var.set(s.enhance_text)
+            self._mic_status.configure(text="")
+
+        if "API" in self._built_tabs:
+            self._api_key_var.set(s.api_key)
+            self._whisper_var.set(s.whisper_model)
+            self._gpt_var.set(s.gpt_model)
+            self._api_status.configure(text="")
+
+        if "Usage" in self._built_tabs:
+            self._update_usage()
+
     def _start_hotkey_capture(self) -> None:
         """Start capturing a new hotkey."""
         if self._capturing_hotkey:
@@ -517,16 +611,16 @@ class SettingsWindow:
     def _test_microphone(self) -> None:
         """Test the selected microphone with a short recording."""
         import threading
-        import time
+
+        if self._mic_testing:
+            return
+        self._mic_testing = True
+        self._test_mic_btn.configure(state="disabled")
 
         # Get selected device index
         selected_name = self._audio_device_var.get()
-        device_index = None
-        if selected_name != "System Default":
-            for device in self._audio_devices:
-                if device["name"] == selected_name:
-                    device_index = device["index"]
-                    break
+        device = self._device_by_name.get(selected_name)
+        device_index = device["index"] if device is not None else None
 
         def test():
             try:
@@ -535,20 +629,37 @@ class SettingsWindow:
 
                 self._mic_status.configure(text="Recording...", text_color="gray")
 
-                # Record 1 second of audio
+                # Stream up to 1 second of audio, stopping after 0.3s once
+                # the level is clearly high enough
                 duration = 1.0
+                early_exit = 0.3
                 sample_rate = 16000
-                audio = sd.rec(
-                    int(duration * sample_rate),
+                level_sum = 0.0
+                samples = 0
+                done = threading.Event()
+
+                def callback(indata, frames, time_info, status):
+                    nonlocal level_sum, samples
+                    # float32 samples are already in [-1, 1]
+                    level_sum += float(np.abs(indata).sum())
+                    samples += frames
+                    if samples >= duration * sample_rate or (
+                        samples >= early_exit * sample_rate and level_sum / samples > 0.01
+                    ):
+                        done.set()
+                        raise sd.CallbackStop
+
+                with sd.InputStream(
                     samplerate=sample_rate,
                     channels=1,
-                    dtype=np.int16,
+                    dtype="float32",
                     device=device_index,
-                )
-                sd.wait()
+                    callback=callback,
+                ):
+                    done.wait(timeout=duration + 1.0)
 
                 # Check audio level
-                avg_level = np.abs(audio).mean() / 32768.0
+                avg_level = level_sum / samples if samples else 0.0
 
                 if avg_level > 0.01:
                     self._mic_status.configure(
@@ -571,6 +682,8 @@ class SettingsWindow:
                     text=f"Error: {str(e)[:50]}",
                     text_color="#E53935"
                 )
+            finally:
+                self._after_test(self._finish_mic_test)
 
         self._mic_status.configure(text="Testing...", text_color="gray")
         threading.Thread(target=test, daemon=True).start()
@@ -579,6 +692,11 @@ class SettingsWindow:
         """Test the API connection."""
         import threading
 
+        if self._api_testing:
+            return
+        self._api_testing = True
+        self._test_api_btn.configure(state="disabled")
+
         # Get the API key directly from the entry widget
         api_key = self._api_key_entry.get().strip()
 
@@ -593,59 +711,90 @@ class SettingsWindow:
                     return
                 print(f"Testing API key (length: {len(api_key)}, starts: {api_key[:20]}...)")
                 client = OpenAI(api_key=api_key)
-                # Simple test - list models
-                client.models.list()
+                # Simple test - fetch a single model object
+                client.models.retrieve("whisper-1")
                 self._api_status.configure(text="Connection successful!", text_color="#4CAF50")
             except Exception as e:
                 self._api_status.configure(text=f"Error: {str(e)}", text_color="#E53935")
+            finally:
+                self._after_test(self._finish_api_test)
 
         self._api_status.configure(text="Testing...", text_color="gray")
         threading.Thread(target=test, daemon=True).start()
 
+    def _after_test(self, callback: Callable[[], None]) -> None:
+        """Schedule a test-finished callback on the Tk thread."""
+        try:
+            if self._window:
+                self._window.after(0, callback)
+                return
+        except Exception:
+            pass  # Window destroyed while the test was running
+        callback()
+
+    def _finish_mic_test(self) -> None:
+        """Allow the microphone test to run again."""
+        self._mic_testing = False
+        try:
+            self._test_mic_btn.configure(state="normal")
+        except Exception:
+            pass
+
+    def _finish_api_test(self) -> None:
+        """Allow the API test to run again."""
+        self._api_testing = False
+        try:
+            self._test_api_btn.configure(state="normal")
+        except Exception:
+            pass
+
     def _save(self) -> None:
         """Save settings."""
-        # Update settings - read directly from entry widgets
-        self._settings.hotkey = self._hotkey_entry.get().strip()
-
-        # Extract language code from "code: name" format
-        lang_selection = self._lang_var.get()
-        self._settings.language = lang_selection.split(":")[0]
+        # Collect values from the form - read directly from entry widgets
+        new = {
+            "hotkey": self._hotkey_entry.get().strip(),
+            # Extract language code from "code: name" format
+            "language": self._lang_var.get().split(":")[0],
+            "indicator_position": self._pos_var.get(),
+            "enhance_text": self._enhance_var.get(),
+            "max_recording_seconds": _DURATION_VALUES.get(self._duration_var.get(), 300),
+            "auto_stop_recording": self._auto_stop_var.get(),
+            "audio_device_index": self._settings.audio_device_index,
+        }
 
-        self._settings.indicator_position = self._pos_var.get()
-        self._settings.enhance_text = self._enhance_var.get()
-        self._settings.api_key = self._api_key_entry.get().strip()
-        self._settings.whisper_model = self._whisper_var.get()
-        self._settings.gpt_model = self._gpt_var.get()
+        # API tab widgets only exist once the tab has been opened
+        if "API" in self._built_tabs:
+            new["api_key"] = self._api_key_entry.get().strip()
+            new["whisper_model"] = self._whisper_var.get()
+            new["gpt_model"] = self._gpt_var.get()
 
         # Audio device selection
         selected_name = self._audio_device_var.get()
         if selected_name == "System Default":
-            self._settings.audio_device_index = None
+            new["audio_device_index"] = None
         else:
-            for device in self._audio_devices:
-                if device["name"] == selected_name:
-                    self._settings.audio_device_index = device["index"]
-                    break
+            device = self._device_by_name.get(selected_name)
+            if device is not None:
+                new["audio_device_index"] = device["index"]
 
-        # Recording limits
-        duration_name = self._duration_var.get()
-        self._settings.max_recording_seconds = self._duration_values.get(duration_name, 300)
-        self._settings.auto_stop_recording = self._auto_stop_var.get()
+        old = {k: getattr(self._settings, k) for k in new}
 
-        # Save to file
-        self._settings.save()
+        # Only write the settings file when something actually changed
+        if new != old:
+            for key, value in new.items():
+                setattr(self._settings, key, value)
 
-        # Callback
-        if self._on_save:
-            self._on_save(self._settings)
+            # Save to file
+            self._settings.save()
 
-        # Close window
-        if self._window:
-            self._window.destroy()
-            self._window = None
+            # Callback
+            if self._on_save:
+                self._on_save(self._settings)
+
+        # Hide window (kept alive for the next open)
+        self.close()
 
     def close(self) -> None:
-        """Close the settings window."""
-        if self._window:
-            self._window.destroy()
-            self._window = None
+        """Close the settings window, hiding it so the next open is instant."""
+        if self._window is not None and self._window.winfo_exists():
+            self._window.withdraw()
@@ -1,27 +1,37 @@
 """System tray integration for Ditado."""
 
-import os
-import sys
 import threading
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Sequence, Tuple
+import numpy as np
 from PIL import Image
 import pystray
+from ._assets import asset_path as get_asset_path
 
 
-def get_asset_path(filename: str) -> str:
-    """Get the path to an asset file, works for both dev and bundled exe."""
-    if getattr(sys, 'frozen', False):
-        # Running as bundled exe
-        base_path = sys._MEIPASS
-    else:
-        # Running in development
-        base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    return os.path.join(base_path, "assets", filename)
+# Grayscale weights matching PIL's "L" conversion
+_LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def _rounded_square_mask(size: int, inset: int, radius: int) -> np.ndarray:
+    """Boolean mask of a rounded square spanning [inset, size - inset]."""
+    y, x = np.ogrid[:size, :size]
+    lo, hi = inset + radius, size - inset - radius
+    dx = np.maximum(np.maximum(lo - x, x - hi), 0)
+    dy = np.maximum(np.maximum(lo - y, y - hi), 0)
+    return dx * dx + dy * dy <= radius * radius
+
+
+# Fallback icon shape, computed once at import
+_FALLBACK_MASK = _rounded_square_mask(64, inset=4, radius=8)
 
 
 class SystemTray:
     """System tray icon with menu."""
 
+    # Quiet period before a menu toggle / set_enabled call is applied (seconds)
+    TOGGLE_DEBOUNCE = 0.1
+    SET_ENABLED_DEBOUNCE = 0.05
+
     def __init__(
         self,
         on_toggle: Optional[Callable[[bool], None]] = None,
@@ -48,84 +58,148 @@ class SystemTray:
         self._enabled = True
         self._icon: Optional[pystray.Icon] = None
         self._thread: Optional[threading.Thread] = None
+        self._icons: Dict[bool, Image.Image] = {}
+        self._applied_enabled = True
+        self._toggle_timer: Optional[threading.Timer] = None
+        self._toggle_lock = threading.Lock()
 
     def start(self) -> None:
         """Start the system tray icon."""
         if self._icon is not None:
             return
 
-        # Create the icon
-        image = self._create_icon()
-
-        # Create menu (Settings integrated into Dashboard)
-        menu = pystray.Menu(
-            pystray.MenuItem("Show Dashboard", self._show_dashboard),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem(
-                "Enabled",
-                self._toggle_enabled,
-                checked=lambda item: self._enabled,
-            ),
-            pystray.Menu.SEPARATOR,
-            pystray.MenuItem("Exit", self._exit),
-        )
+        # Build both icon variants once so toggling only swaps images
+        if not self._icons:
+            enabled, disabled = self._create_icons()
+            self._icons = {True: enabled, False: disabled}
 
         self._icon = pystray.Icon(
             name="Ditado",
-            icon=image,
+            icon=self._current_icon(),
             title="Ditado - Voice Dictation",
-            menu=menu,
+            menu=pystray.Menu(*self._default_menu_items()),
         )
 
-        # Run in a separate thread
+        # Run in a separate daemon thread. pystray's run_detached() is not
+        # used: on Win32 it also spawns a thread, just a non-daemon one that
+        # could keep the process alive if the app exits without stop()
         self._thread = threading.Thread(target=self._icon.run, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
         """Stop the system tray icon."""
+        with self._toggle_lock:
+            if self._toggle_timer is not None:
+                self._toggle_timer.cancel()
+                self._toggle_timer = None
         if self._icon:
             self._icon.stop()
             self._icon = None
 
+    def reconfigure(self, menu_items: Optional[Sequence[pystray.MenuItem]] = None) -> None:
+        """
+        Replace the tray menu on the running icon.
+
+        Updates the live icon in place rather than stopping and restarting
+        it, so no new thread or shell icon registration is needed.
+
+        Args:
+            menu_items: New menu items (defaults to the standard menu)
+        """
+        if self._icon is None:
+            return
+        if menu_items is None:
+            menu_items = self._default_menu_items()
+        self._icon.menu = pystray.Menu(*menu_items)
+        self._icon.update_menu()
+        self._update_icon()
+
     def set_enabled(self, enabled: bool) -> None:
         """Update the enabled state."""
+        if enabled == self._enabled:
+            return  # No change; avoid rebuilding the HICON
         self._enabled = enabled
-        if self._icon:
-            self._icon.icon = self._create_icon()
+        # Set by the app, so it must not be echoed back through on_toggle
+        self._applied_enabled = enabled
+        self._schedule_apply(self.SET_ENABLED_DEBOUNCE)
 
     def show_notification(self, title: str, message: str) -> None:
         """Show a system notification."""
         if self._icon:
             self._icon.notify(message, title)
 
-    def _create_icon(self) -> Image.Image:
-        """Create the tray icon image from logo PNG."""
+    def _default_menu_items(self) -> Tuple[pystray.MenuItem, ...]:
+        """Build the standard menu (Settings integrated into Dashboard)."""
+        return (
+            pystray.MenuItem("Show Dashboard", self._show_dashboard),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem(
+                "Enabled",
+                self._toggle_enabled,
+                checked=lambda item: self._enabled,
+            ),
+            pystray.Menu.SEPARATOR,
+            pystray.MenuItem("Exit", self._exit),
+        )
+
+    def _current_icon(self) -> Image.Image:
+        """Get the cached icon image for the current enabled state."""
+        return self._icons[self._enabled]
+
+    def _update_icon(self) -> None:
+        """Push the current icon to the tray, skipping no-op assignments."""
+        # pystray's Win32 backend rebuilds the HICON (ICO encode + LoadImage)
+        # on every assignment, so this identity guard is the only place the
+        # conversion can be avoided without reaching into pystray internals
+        icon = self._icon
+        if icon is None:
+            return
+        current = self._current_icon()
+        if icon.icon is not current:
+            icon.icon = current
+
+    def _create_icons(self) -> Tuple[Image.Image, Image.Image]:
+        """Create the enabled and disabled tray icon images from logo PNG."""
         size = 64
+
+        try:
+            # Pre-sized variants generated by assets/create_icon.py
+            return self._open_icon("logo_64.png"), self._open_icon("logo_64_gray.png")
+        except Exception:
+            pass  # Missing or unreadable; resize logo.png instead
+
         logo_path = get_asset_path("logo.png")
 
         try:
-            # Load and resize the logo
+            # Load and resize the logo once for both variants
             logo = Image.open(logo_path)
             if logo.mode != "RGBA":
                 logo = logo.convert("RGBA")
             image = logo.resize((size, size), Image.Resampling.LANCZOS)
 
-            # If disabled, convert to grayscale
-            if not self._enabled:
-                # Convert to grayscale while preserving alpha
-                r, g, b, a = image.split()
-                gray = Image.merge("RGB", (r, g, b)).convert("L")
-                image = Image.merge("RGBA", (gray, gray, gray, a))
+            # Disabled variant: grayscale (ITU-R 601 luma) preserving alpha
+            arr = np.asarray(image)
+            gray = (arr[..., :3] @ _LUMA_WEIGHTS).round().astype(np.uint8)
+            disabled = Image.fromarray(np.dstack((gray, gray, gray, arr[..., 3])), "RGBA")
 
-            return image
+            return image, disabled
         except Exception:
             # Fallback to a simple colored square if logo not found
-            image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-            color = "#D4E157" if self._enabled else "#666666"
-            from PIL import ImageDraw
-            draw = ImageDraw.Draw(image)
-            draw.rounded_rectangle([4, 4, size - 4, size - 4], radius=8, fill=color)
-            return image
+            return self._fallback_icon((212, 225, 87)), self._fallback_icon((102, 102, 102))
+
+    @staticmethod
+    def _open_icon(filename: str) -> Image.Image:
+        """Open and fully decode a pre-composed icon asset."""
+        image = Image.open(get_asset_path(filename))
+        image.load()
+        return image if image.mode == "RGBA" else image.convert("RGBA")
+
+    @staticmethod
+    def _fallback_icon(color: Tuple[int, int, int]) -> Image.Image:
+        """Build a plain rounded square icon from the precomputed mask."""
+        arr = np.zeros(_FALLBACK_MASK.shape + (4,), dtype=np.uint8)
+        arr[_FALLBACK_MASK] = (*color, 255)
+        return Image.fromarray(arr, "RGBA")
 
     def _show_dashboard(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
         """Show the dashboard window."""
@@ -135,9 +209,29 @@ class SystemTray:
     def _toggle_enabled(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
         """Toggle enabled state."""
         self._enabled = not self._enabled
-        icon.icon = self._create_icon()
+        self._schedule_apply(self.TOGGLE_DEBOUNCE)
+
+    def _schedule_apply(self, delay: float) -> None:
+        """Coalesce rapid state changes: apply once they settle."""
+        with self._toggle_lock:
+            if self._toggle_timer is not None:
+                self._toggle_timer.cancel()
+            self._toggle_timer = threading.Timer(delay, self._apply_enabled)
+            self._toggle_timer.daemon = True
+            self._toggle_timer.start()
+
+    def _apply_enabled(self) -> None:
+        """Apply the settled enabled state to the icon and the app."""
+        with self._toggle_lock:
+            self._toggle_timer = None
+        self._update_icon()
+
+        enabled = self._enabled
+        if enabled == self._applied_enabled:
+            return  # Toggled back to where it started
+        self._applied_enabled = enabled
         if self._on_toggle:
-            self._on_toggle(self._enabled)
+            self._on_toggle(enabled)
 
     def _exit(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
         """Exit the application."""
@@ -1,5 +1,5 @@
 """Utility modules for Ditado."""
 
-from .logger import get_logger, setup_logging
+from .logger import get_logger, setup_logging, shutdown_logging
 
-__all__ = ["get_logger", "setup_logging"]
+__all__ = ["get_logger", "setup_logging", "shutdown_logging"]
@@ -1,11 +1,37 @@
 """Windows autostart management for Ditado."""
 
+import ctypes
 import sys
+import time
 import winreg
+from ctypes import wintypes
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
 
 APP_NAME = "Ditado"
 REG_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
+STATUS_TTL = 2.0  # Seconds a registry status read stays valid
+
+# RegGetValueW opens, queries and closes the key in one call
+_RegGetValueW = ctypes.WinDLL("advapi32").RegGetValueW
+_RegGetValueW.argtypes = [
+    wintypes.HKEY, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+    wintypes.LPDWORD, wintypes.LPVOID, wintypes.LPDWORD,
+]
+_RegGetValueW.restype = wintypes.LONG
+RRF_RT_ANY = 0x0000FFFF
+ERROR_SUCCESS = 0
+ERROR_FILE_NOT_FOUND = 2
+
+# (timestamp, enabled) of the last known registry state
+_cached_status: Optional[Tuple[float, bool]] = None
+
+
+def _remember_status(enabled: bool) -> None:
+    """Record the current autostart state for is_autostart_enabled."""
+    global _cached_status
+    _cached_status = (time.monotonic(), enabled)
 
 
 def get_executable_path() -> str:
@@ -20,24 +46,41 @@ def get_executable_path() -> str:
         return f'"{pythonw}" "{run_py}"'
 
 
+@contextmanager
+def _open_run_key(access: int) -> Iterator[winreg.HKEYType]:
+    """Open the current user's Run key once for one or more operations."""
+    with winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_PATH, 0, access) as key:
+        yield key
+
+
 def is_autostart_enabled() -> bool:
     """Check if Ditado is set to start on boot."""
-    try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_READ) as key:
-            winreg.QueryValueEx(key, APP_NAME)
-            return True
-    except FileNotFoundError:
-        return False
-    except Exception:
+    if _cached_status is not None and time.monotonic() - _cached_status[0] < STATUS_TTL:
+        return _cached_status[1]
+
+    # Probe for the value without reading its data; a missing key or
+    # value is reported as a status code, not an exception
+    status = _RegGetValueW(
+        winreg.HKEY_CURRENT_USER, REG_PATH, APP_NAME, RRF_RT_ANY, None, None, None
+    )
+    if status == ERROR_SUCCESS:
+        enabled = True
+    elif status == ERROR_FILE_NOT_FOUND:
+        enabled = False
+    else:
         return False
 
+    _remember_status(enabled)
+    return enabled
+
 
 def enable_autostart() -> bool:
     """Add Ditado to Windows startup."""
     try:
         exe_path = get_executable_path()
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_SET_VALUE) as key:
+        with _open_run_key(winreg.KEY_SET_VALUE) as key:
             winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, exe_path)
+        _remember_status(True)
         return True
     except Exception as e:
         print(f"Failed to enable autostart: {e}")
@@ -47,10 +90,12 @@ def enable_autostart() -> bool:
 def disable_autostart() -> bool:
     """Remove Ditado from Windows startup."""
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, REG_PATH, 0, winreg.KEY_SET_VALUE) as key:
+        with _open_run_key(winreg.KEY_SET_VALUE) as key:
             winreg.DeleteValue(key, APP_NAME)
+        _remember_status(False)
         return True
     except FileNotFoundError:
+        _remember_status(False)
         return True  # Already not in startup
     except Exception as e:
         print(f"Failed to disable autostart: {e}")
@@ -63,3 +108,17 @@ def set_autostart(enabled: bool) -> bool:
         return enable_autostart()
     else:
         return disable_autostart()
+
+
+def set_autostart_batch(values: Dict[str, str]) -> bool:
+    """Write several Run entries (name -> command) with a single key open."""
+    try:
+        with _open_run_key(winreg.KEY_SET_VALUE) as key:
+            for name, command in values.items():
+                winreg.SetValueEx(key, name, 0, winreg.REG_SZ, command)
+        if APP_NAME in values:
+            _remember_status(True)
+        return True
+    except Exception as e:
+        print(f"Failed to update autostart entries: {e}")
+        return False
@@ -1,10 +1,15 @@
 """Logging configuration for Ditado."""
 
+import atexit
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
 
 # Log directory
 LOG_DIR = Path.home() / ".ditado" / "logs"
@@ -13,13 +18,111 @@ LOG_FILE = LOG_DIR / "ditado.log"
 # Log format
 LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_FORMATTER = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
 
 # Default settings
 DEFAULT_LEVEL = logging.INFO
 MAX_BYTES = 5 * 1024 * 1024  # 5 MB
 BACKUP_COUNT = 5  # Keep 5 log files
+BUFFER_CAPACITY = 64  # Records batched before a file write
+FLUSH_INTERVAL = 2.0  # Max seconds a buffered record waits for a write
+STREAM_BUFFER_SIZE = 64 * 1024  # Log file write buffer (bytes)
+
+# Child loggers used by the app's modules, created up front in setup_logging
+KNOWN_LOGGERS = ("app", "recorder", "muter", "whisper", "enhancer")
+
+# Mirrors whether DEBUG records are emitted. Read it through the module
+# (``logger.DEBUG_ENABLED``) to skip building expensive debug arguments:
+#     if logger.DEBUG_ENABLED: log.debug("big %s", expensive())
+DEBUG_ENABLED = False
 
 _initialized = False
+_listener: "Optional[QueueListener]" = None
+
+
+def _create_file_handler() -> logging.Handler:
+    """Create the rotating log file handler with a large write buffer."""
+    from logging.handlers import RotatingFileHandler
+
+    class BufferedRotatingFileHandler(RotatingFileHandler):
+        """Rotating handler that flushes its 64KB buffer on WARNING+ or every 2s."""
+
+        def _open(self):
+            stream = open(
+                self.baseFilename,
+                self.mode,
+                buffering=STREAM_BUFFER_SIZE,
+                encoding=self.encoding,
+                errors="replace",
+            )
+            # Track the size ourselves; the stock shouldRollover seeks the
+            # stream on every record, which would flush the buffer each time
+            self._size = os.fstat(stream.fileno()).st_size
+            self._regular_file = os.path.isfile(self.baseFilename)
+            self._flushed_at = 0.0  # record.created of the last flush
+            return stream
+
+        def _encoded_size(self, msg: str) -> int:
+            """Bytes msg takes on disk (MAX_BYTES is a byte limit)."""
+            size = len(msg.encode(self.encoding, "replace"))
+            # Text mode writes each "\n" as os.linesep
+            return size + msg.count("\n") * (len(os.linesep) - 1)
+
+        def emit(self, record: logging.LogRecord) -> None:
+            # Same as RotatingFileHandler.emit, minus the per-record flush.
+            # The app exits via os._exit, so logging.shutdown() never runs;
+            # shutdown_logging() closes this handler to write out the rest
+            try:
+                msg = self.format(record) + self.terminator
+                size = self._encoded_size(msg)
+                if self.stream is None:
+                    self.stream = self._open()
+                if (
+                    self.maxBytes > 0
+                    and self._regular_file
+                    and self._size + size >= self.maxBytes
+                ):
+                    self.doRollover()  # Reopens the stream, resetting _size
+                self.stream.write(msg)
+                self._size += size
+                if (
+                    record.levelno >= logging.WARNING
+                    or record.created - self._flushed_at >= FLUSH_INTERVAL
+                ):
+                    self.stream.flush()
+                    self._flushed_at = record.created
+            except Exception:
+                self.handleError(record)
+
+    return BufferedRotatingFileHandler(
+        LOG_FILE,
+        maxBytes=MAX_BYTES,
+        backupCount=BACKUP_COUNT,
+        encoding="utf-8",
+    )
+
+
+def _create_buffer_handler(target: logging.Handler) -> logging.Handler:
+    """Create the in-memory batching handler in front of the file handler."""
+    from logging.handlers import MemoryHandler
+
+    class TimedMemoryHandler(MemoryHandler):
+        """MemoryHandler that also flushes once its oldest record is stale."""
+
+        def shouldFlush(self, record: logging.LogRecord) -> bool:
+            # Called right after record is appended, so buffer is non-empty
+            return (
+                super().shouldFlush(record)
+                or record.created - self.buffer[0].created >= FLUSH_INTERVAL
+            )
+
+    # Warnings and errors flush immediately
+    return TimedMemoryHandler(
+        BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=target,
+        flushOnClose=True,
+    )
 
 
 def setup_logging(level: int = DEFAULT_LEVEL, debug: bool = False) -> None:
@@ -30,17 +133,23 @@ def setup_logging(level: int = DEFAULT_LEVEL, debug: bool = False) -> None:
         level: Logging level (default INFO)
         debug: If True, enable DEBUG level and console output
     """
-    global _initialized
+    global _initialized, _listener, DEBUG_ENABLED
 
     if _initialized:
         return
 
-    # Create log directory
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    # Only needed once logging is actually set up
+    from logging.handlers import QueueHandler, QueueListener
+    from queue import Queue
+
+    # Create log directory (skip the makedirs walk when it already exists)
+    if not LOG_DIR.exists():
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     # Set level
     if debug:
         level = logging.DEBUG
+    DEBUG_ENABLED = level <= logging.DEBUG
 
     # Create root logger for Ditado
     root_logger = logging.getLogger("ditado")
@@ -48,32 +157,68 @@ def setup_logging(level: int = DEFAULT_LEVEL, debug: bool = False) -> None:
 
     # Remove existing handlers
     root_logger.handlers.clear()
+    handlers: List[logging.Handler] = []
 
     # File handler with rotation
     try:
-        file_handler = RotatingFileHandler(
-            LOG_FILE,
-            maxBytes=MAX_BYTES,
-            backupCount=BACKUP_COUNT,
-            encoding="utf-8",
-        )
+        file_handler = _create_file_handler()
         file_handler.setLevel(level)
-        file_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(_FORMATTER)
+
+        # Batch records into fewer writes
+        buffered = _create_buffer_handler(file_handler)
+        buffered.setLevel(level)
+        handlers.append(buffered)
     except Exception as e:
         print(f"Warning: Could not create log file: {e}")
 
     # Console handler (only in debug mode or if no file handler)
-    if debug or not root_logger.handlers:
+    if debug or not handlers:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_handler.setFormatter(logging.Formatter(LOG_FORMAT, DATE_FORMAT))
-        root_logger.addHandler(console_handler)
+        console_handler.setFormatter(_FORMATTER)
+        handlers.append(console_handler)
+
+    # Callers only enqueue records; a background thread does the I/O,
+    # including RotatingFileHandler.doRollover when MAX_BYTES is reached.
+    # That thread also serializes writes, so rotation needs no extra lock
+    log_queue: Queue = Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
 
     _initialized = True
+
+    # Pre-create known children so each module's get_logger is a cache hit
+    for name in KNOWN_LOGGERS:
+        _resolve_logger(name)
+
     root_logger.info("Ditado logging initialized")
 
 
+def shutdown_logging() -> None:
+    """
+    Stop the log listener thread and write everything buffered to disk.
+
+    DitadoApp.stop() ends with os._exit(), which skips atexit handlers,
+    so it must call this explicitly. Safe to call more than once.
+    """
+    global _listener
+
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+
+    listener.stop()  # Drains the queue into the handlers
+    for handler in listener.handlers:
+        target = getattr(handler, "target", None)
+        handler.flush()  # Hands the MemoryHandler's records to its target
+        handler.close()
+        if target is not None:
+            target.close()
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger for a specific module.
@@ -88,6 +233,12 @@ def get_logger(name: str) -> logging.Logger:
     if not _initialized:
         setup_logging()
 
+    return _resolve_logger(name)
+
+
+@lru_cache(maxsize=128)
+def _resolve_logger(name: str) -> logging.Logger:
+    """Resolve a module name to its ditado logger (cached per name)."""
     # Prefix with ditado if not already
     if not name.startswith("ditado"):
         name = f"ditado.{name}"
@@ -97,13 +248,19 @@ def get_logger(name: str) -> logging.Logger:
 
 def set_debug_mode(enabled: bool) -> None:
     """Enable or disable debug mode."""
+    global DEBUG_ENABLED
+    DEBUG_ENABLED = enabled
+
     logger = logging.getLogger("ditado")
+    handlers = list(logger.handlers)
+    if _listener is not None:
+        handlers.extend(_listener.handlers)
 
     if enabled:
         logger.setLevel(logging.DEBUG)
-        for handler in logger.handlers:
+        for handler in handlers:
             handler.setLevel(logging.DEBUG)
     else:
         logger.setLevel(logging.INFO)
-        for handler in logger.handlers:
+        for handler in handlers:
             handler.setLevel(logging.INFO)